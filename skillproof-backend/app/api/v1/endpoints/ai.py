@@ -2,25 +2,46 @@
 AI Endpoints - Interview question generation and answer analysis
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+import hashlib
+import json
+import logging
+
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
+
+from app.ml.ai_client import get_ai_client, AIClient, AIClientError, AIProvider
+
+logger = logging.getLogger(__name__)
 
-from app.ml.ai_client import get_ai_client, AIClientError, AIProvider
+# AI payloads can be large; serialize them with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+# Generic error details; underlying errors are logged, never echoed to clients
+AI_UNAVAILABLE_DETAIL = "AI service unavailable"
+AI_INTERNAL_DETAIL = "Internal error"
+
+# Generated questions keyed by normalized request; repeat prompts skip the LLM
+question_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+# In-flight question generations keyed by cache key
+_question_inflight: Dict[str, asyncio.Task] = {}
 
 
 class GenerateQuestionRequest(BaseModel):
     job_description: str
     candidate_background: str
     question_number: int
+    stream: bool = False
 
 
 class AnalyzeAnswerRequest(BaseModel):
     question: str
     answer: str
     job_requirements: str
+    stream: bool = False
 
 
 class GenerateTextRequest(BaseModel):
@@ -29,10 +50,57 @@ class GenerateTextRequest(BaseModel):
     model: Optional[str] = None
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
+    stream: bool = False
+
+
+def get_app_ai_client(request: Request) -> AIClient:
+    """Dependency returning the AI client created at app startup"""
+    ai_client = getattr(request.app.state, "ai_client", None)
+    return ai_client or get_ai_client()
+
+
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Wrap text chunks as Server-Sent Events, ending with [DONE]"""
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps({'text': chunk})}\n\n"
+    except AIClientError:
+        logger.exception("AI stream failed")
+        yield f"event: error\ndata: {json.dumps({'detail': AI_UNAVAILABLE_DETAIL})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+def _stream_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Build an SSE response streamed straight from the event loop"""
+    return StreamingResponse(_sse_events(chunks), media_type="text/event-stream")
+
+
+def _question_cache_key(request: GenerateQuestionRequest) -> str:
+    """Hash the normalized question request into a cache key"""
+    raw = "|".join([
+        request.job_description.strip().lower(),
+        request.candidate_background.strip().lower(),
+        str(request.question_number),
+    ])
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def _generate_question(ai_client: AIClient, request: GenerateQuestionRequest, cache_key: str) -> str:
+    """Generate a question upstream and cache it"""
+    question = await ai_client.generate_interview_question_async(
+        job_description=request.job_description,
+        candidate_background=request.candidate_background,
+        question_number=request.question_number,
+    )
+    question_cache[cache_key] = question
+    return question
 
 
 @router.post("/generate-question")
-async def generate_interview_question(request: GenerateQuestionRequest):
+async def generate_interview_question(
+    request: GenerateQuestionRequest,
+    ai_client: AIClient = Depends(get_app_ai_client),
+):
     """
     Generate AI interview question based on job description and candidate background.
     
@@ -44,15 +112,31 @@ async def generate_interview_question(request: GenerateQuestionRequest):
         "question_number": 1
     }
     ```
+    
+    Set `"stream": true` to receive the question as Server-Sent Events.
     """
     try:
-        ai_client = get_ai_client()
+        if request.stream:
+            return _stream_response(ai_client.stream_interview_question(
+                job_description=request.job_description,
+                candidate_background=request.candidate_background,
+                question_number=request.question_number,
+            ))
         
-        question = ai_client.generate_interview_question(
-            job_description=request.job_description,
-            candidate_background=request.candidate_background,
-            question_number=request.question_number,
-        )
+        cache_key = _question_cache_key(request)
+        question = question_cache.get(cache_key)
+        
+        if question is None:
+            # Single-flight: concurrent duplicates share one upstream call. Only
+            # the task itself leaves the map, so late arrivals join it rather
+            # than starting a parallel call; shielded so a cancelled caller
+            # doesn't cancel it for the others.
+            task = _question_inflight.get(cache_key)
+            if task is None:
+                task = asyncio.create_task(_generate_question(ai_client, request, cache_key))
+                _question_inflight[cache_key] = task
+                task.add_done_callback(lambda _: _question_inflight.pop(cache_key, None))
+            question = await asyncio.shield(task)
         
         return {
             "success": True,
@@ -60,14 +144,21 @@ async def generate_interview_question(request: GenerateQuestionRequest):
             "question_number": request.question_number,
         }
     
-    except AIClientError as e:
-        raise HTTPException(status_code=503, detail=f"AI service unavailable: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating question: {str(e)}")
+    except HTTPException:
+        raise
+    except AIClientError:
+        logger.exception("AI service unavailable while generating question")
+        raise HTTPException(status_code=503, detail=AI_UNAVAILABLE_DETAIL)
+    except Exception:
+        logger.exception("Error generating question")
+        raise HTTPException(status_code=500, detail=AI_INTERNAL_DETAIL)
 
 
 @router.post("/analyze-answer")
-async def analyze_interview_answer(request: AnalyzeAnswerRequest):
+async def analyze_interview_answer(
+    request: AnalyzeAnswerRequest,
+    ai_client: AIClient = Depends(get_app_ai_client),
+):
     """
     Analyze candidate's interview answer using AI.
     
@@ -79,11 +170,18 @@ async def analyze_interview_answer(request: AnalyzeAnswerRequest):
         "job_requirements": "Senior Python Developer"
     }
     ```
+    
+    Set `"stream": true` to receive the raw analysis as Server-Sent Events.
     """
     try:
-        ai_client = get_ai_client()
+        if request.stream:
+            return _stream_response(ai_client.stream_interview_answer_analysis(
+                question=request.question,
+                answer=request.answer,
+                job_requirements=request.job_requirements,
+            ))
         
-        analysis = ai_client.analyze_interview_answer(
+        analysis = await ai_client.analyze_interview_answer_async(
             question=request.question,
             answer=request.answer,
             job_requirements=request.job_requirements,
@@ -94,14 +192,21 @@ async def analyze_interview_answer(request: AnalyzeAnswerRequest):
             "analysis": analysis,
         }
     
-    except AIClientError as e:
-        raise HTTPException(status_code=503, detail=f"AI service unavailable: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error analyzing answer: {str(e)}")
+    except HTTPException:
+        raise
+    except AIClientError:
+        logger.exception("AI service unavailable while analyzing answer")
+        raise HTTPException(status_code=503, detail=AI_UNAVAILABLE_DETAIL)
+    except Exception:
+        logger.exception("Error analyzing answer")
+        raise HTTPException(status_code=500, detail=AI_INTERNAL_DETAIL)
 
 
 @router.post("/generate-text")
-async def generate_text(request: GenerateTextRequest):
+async def generate_text(
+    request: GenerateTextRequest,
+    ai_client: AIClient = Depends(get_app_ai_client),
+):
     """
     Generate text using AI with custom prompt.
     
@@ -115,10 +220,10 @@ async def generate_text(request: GenerateTextRequest):
         "max_tokens": 500
     }
     ```
+    
+    Set `"stream": true` to receive the text as Server-Sent Events.
     """
     try:
-        ai_client = get_ai_client()
-        
         # Convert provider string to enum if provided
         provider = None
         if request.provider:
@@ -127,7 +232,16 @@ async def generate_text(request: GenerateTextRequest):
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid provider: {request.provider}")
         
-        text = ai_client.generate_text(
+        if request.stream:
+            return _stream_response(ai_client.stream_text_async(
+                prompt=request.prompt,
+                provider=provider,
+                model=request.model,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+            ))
+        
+        text = await ai_client.generate_text_async(
             prompt=request.prompt,
             provider=provider,
             model=request.model,
@@ -141,14 +255,18 @@ async def generate_text(request: GenerateTextRequest):
             "provider": request.provider or "default",
         }
     
-    except AIClientError as e:
-        raise HTTPException(status_code=503, detail=f"AI service unavailable: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating text: {str(e)}")
+    except HTTPException:
+        raise
+    except AIClientError:
+        logger.exception("AI service unavailable while generating text")
+        raise HTTPException(status_code=503, detail=AI_UNAVAILABLE_DETAIL)
+    except Exception:
+        logger.exception("Error generating text")
+        raise HTTPException(status_code=500, detail=AI_INTERNAL_DETAIL)
 
 
 @router.get("/status")
-async def get_ai_status():
+async def get_ai_status(ai_client: AIClient = Depends(get_app_ai_client)):
     """
     Get AI client status and available providers.
     
@@ -159,7 +277,6 @@ async def get_ai_status():
     - Key manager status
     """
     try:
-        ai_client = get_ai_client()
         status = ai_client.get_status()
         
         return {
@@ -167,18 +284,18 @@ async def get_ai_status():
             "status": status,
         }
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting status: {str(e)}")
+    except Exception:
+        logger.exception("Error getting AI status")
+        raise HTTPException(status_code=500, detail=AI_INTERNAL_DETAIL)
 
 
 @router.get("/health")
-async def ai_health_check():
+async def ai_health_check(ai_client: AIClient = Depends(get_app_ai_client)):
     """
     Quick health check for AI services.
     Tests if at least one provider is available.
     """
     try:
-        ai_client = get_ai_client()
         providers = ai_client.key_manager.get_available_providers()
         
         if not providers:
@@ -195,9 +312,10 @@ async def ai_health_check():
             "providers": [p.value for p in providers],
         }
     
-    except Exception as e:
+    except Exception:
+        logger.exception("AI health check failed")
         return {
             "success": False,
-            "message": f"AI services unhealthy: {str(e)}",
+            "message": "AI services unhealthy",
             "healthy": False,
         }
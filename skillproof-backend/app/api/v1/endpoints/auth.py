@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 from datetime import timedelta
-from app.database import get_db
+import asyncio
+from app.database import get_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.utils.security import (
@@ -15,34 +18,44 @@ from app.config import get_settings
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 settings = get_settings()
 
+# Verified against when the email is unknown so login timing does not reveal accounts
+DUMMY_HASH = get_password_hash("dummy-password-for-timing")
+
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
-    # Check if user exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    # Create new user (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password,
         role=user_data.role
     )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    
+    # Unique constraint on email rejects duplicates atomically
+    try:
+        db.add(new_user)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    await db.refresh(new_user)
     
     return new_user
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin, db: Session = Depends(get_db)):
-    # Find user
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.password_hash):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    # Find user (only the columns login needs)
+    result = await db.execute(
+        select(User.id, User.password_hash, User.role, User.is_active)
+        .where(User.email == credentials.email)
+    )
+    user = result.first()
+    hash_to_check = user.password_hash if user else DUMMY_HASH
+    password_ok = await asyncio.to_thread(verify_password, credentials.password, hash_to_check)
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -76,11 +89,11 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     return current_user
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_async_db)):
     """Refresh access token using refresh token"""
     try:
         # Verify refresh token and get user
-        user = get_current_user(refresh_token, db)
+        user = await get_current_user(refresh_token, db)
         
         # Create new tokens
         access_token = create_access_token(
@@ -2,28 +2,98 @@
 Interview Management Endpoints
 Handles interview sessions, questions, and answers
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from pydantic import BaseModel
-from typing import Optional
-import uuid
+from fastapi import APIRouter, HTTPException, Request, Response, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import AsyncIterator, Callable, Dict, Optional
+import asyncio
+import hashlib
+import logging
+import os
+import secrets
+import time
 from datetime import datetime
 
+import anyio
+import orjson
+
 from app.services.interview_manager import interview_manager
 from app.services.audio_processor import audio_processor
 from app.services.ai_service import ai_service
+from app.services.multilingual_interviewer import ExperienceLevel, LanguageCode
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Bound CPU-heavy audio work to one thread per core
+audio_limiter = anyio.CapacityLimiter(os.cpu_count() or 4)
+
+# Audio upload configuration
+AUDIO_UPLOAD_DIR = "uploads/interviews"
+
+# Polled GET responses may be reused briefly and revalidated with ETags
+POLL_CACHE_CONTROL = "private, max-age=1"
+
+
+def _etag(*state) -> str:
+    """ETag over the values that determine a polled response"""
+    return f'"{hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()}"'
+
+
+def _conditional_response(request: Request, etag: str, build: Callable[[], Dict]) -> Response:
+    """
+    Return 304 when the client already has this state, else the JSON body
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        etag: ETag of the current state
+        build: Builds the response payload; only called on a miss
+        
+    Returns:
+        304 Response or ORJSONResponse with caching headers
+    """
+    headers = {"ETag": etag, "Cache-Control": POLL_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(build(), headers=headers)
+
+
+# Static health check data
+HEALTH_FEATURES = (
+    "AI-powered questions",
+    "Real-time evaluation",
+    "Audio transcription",
+    "Multilingual support"
+)
+
+# Health timestamp, refreshed at most once per second
+_health_timestamp = (0, "")
+
+
+def _health_iso_timestamp() -> str:
+    """Current ISO timestamp at one-second granularity"""
+    global _health_timestamp
+    now = int(time.time())
+    if now != _health_timestamp[0]:
+        _health_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _health_timestamp[1]
+
 
 class StartInterviewRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     user_id: str
     role: str
-    experience_level: str
-    language: str = "english"
+    experience_level: ExperienceLevel
+    language: LanguageCode = "english"
     max_questions: int = 5
 
 
 class SubmitAnswerRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     session_id: str
     question_number: int
     previous_question: str
@@ -42,16 +112,16 @@ async def start_interview(request: StartInterviewRequest):
     """
     try:
         # Generate unique session ID
-        session_id = f"session_{uuid.uuid4().hex[:12]}"
+        session_id = f"session_{secrets.token_urlsafe(12)}"
         
         # Create session
-        session = interview_manager.create_session(
+        session = await interview_manager.create_session(
             user_id=request.user_id,
             session_id=session_id
         )
         
         # Generate first question using AI
-        ai_response = ai_service.generate_or_evaluate(
+        ai_response = await ai_service.generate_or_evaluate_async(
             role=request.role,
             experience_level=request.experience_level,
             language=request.language,
@@ -82,15 +152,19 @@ async def start_interview(request: StartInterviewRequest):
 
 
 @router.get("/session/{session_id}")
-async def get_session(session_id: str):
+async def get_session(session_id: str, request: Request):
     """
     Get interview session details
     """
-    session = interview_manager.get_session(session_id)
+    session = await interview_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return {
+    etag = _etag(
+        session.session_id, session.status, session.current_question,
+        len(session.answers), session.total_duration
+    )
+    return _conditional_response(request, etag, lambda: {
         "session_id": session.session_id,
         "user_id": session.user_id,
         "status": session.status,
@@ -99,25 +173,25 @@ async def get_session(session_id: str):
         "total_questions": len(session.questions),
         "answered": len(session.answers),
         "total_duration": session.total_duration
-    }
+    })
 
 
 @router.get("/question/{session_id}")
-async def get_current_question(session_id: str):
+async def get_current_question(session_id: str, request: Request):
     """
     Get current question for session
     """
-    question = interview_manager.get_current_question(session_id)
+    question = await interview_manager.get_current_question(session_id)
     if not question:
         raise HTTPException(status_code=404, detail="No current question or session not found")
     
-    return {
+    return _conditional_response(request, _etag(session_id, question.id), lambda: {
         "id": question.id,
         "text": question.text,
         "category": question.category,
         "difficulty": question.difficulty,
         "expected_duration": question.expected_duration
-    }
+    })
 
 
 @router.post("/submit-answer")
@@ -127,52 +201,66 @@ async def submit_answer(request: SubmitAnswerRequest):
     """
     try:
         # Get session
-        session = interview_manager.get_session(request.session_id)
+        session = await interview_manager.get_session(request.session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Use AI to evaluate answer and generate next question
-        ai_response = ai_service.generate_or_evaluate(
-            role=session.questions[0].category if session.questions else "Developer",  # Use stored role
-            experience_level="mid",  # Use stored experience level
-            language="english",  # Use stored language
-            previous_question=request.previous_question,
-            candidate_answer=request.transcript,
-            question_number=request.question_number,
-            max_questions=len(session.questions)
-        )
+        role = session.questions[0].category if session.questions else "Developer"  # Use stored role
+        experience_level = "mid"  # Use stored experience level
+        language = "english"  # Use stored language
+        max_questions = len(session.questions)
+        is_last_question = request.question_number >= max_questions
         
-        # Save answer
-        success = interview_manager.submit_answer(
+        # Save the answer first (a cheap Redis round-trip) so a missing or
+        # finished session is rejected before any paid LLM call starts
+        progress, _ = await interview_manager.submit_and_advance(
             session_id=request.session_id,
             transcript=request.transcript,
             duration=request.duration,
             confidence=request.confidence
         )
-        
-        if not success:
+        if progress is None:
             raise HTTPException(status_code=400, detail="Failed to submit answer")
         
-        # Get progress
-        progress = interview_manager.get_progress(request.session_id)
+        # Evaluation and next question are independent; run them together
+        pending = [
+            ai_service.evaluate_answer_async(
+                role=role,
+                experience_level=experience_level,
+                language=language,
+                question=request.previous_question,
+                candidate_answer=request.transcript
+            ),
+        ]
+        if not is_last_question:
+            pending.append(ai_service.next_question_async(
+                role=role,
+                experience_level=experience_level,
+                language=language,
+                previous_question=request.previous_question,
+                question_number=request.question_number + 1,
+                max_questions=max_questions
+            ))
+        
+        evaluation, *next_question = await asyncio.gather(*pending)
         
         # Prepare response
         result = {
             "status": "success",
             "message": "Answer submitted successfully",
             "progress": progress,
-            "interview_status": ai_response.get("interview_status", "IN_PROGRESS")
+            "interview_status": "COMPLETED" if is_last_question else "IN_PROGRESS"
         }
         
         # Add evaluation if present
-        if "evaluation" in ai_response and ai_response["evaluation"]:
-            result["evaluation"] = ai_response["evaluation"]
+        if evaluation:
+            result["evaluation"] = evaluation
         
         # Add next question if not complete
-        if ai_response.get("interview_status") != "COMPLETED":
+        if next_question:
             result["next_question"] = {
-                "text": ai_response.get("question", ""),
-                "difficulty": ai_response.get("difficulty", "medium")
+                "text": next_question[0].get("question", ""),
+                "difficulty": next_question[0].get("difficulty", "medium")
             }
         
         return result
@@ -183,6 +271,90 @@ async def submit_answer(request: SubmitAnswerRequest):
         raise HTTPException(status_code=500, detail=f"Failed to process answer: {str(e)}")
 
 
+@router.post("/submit-answer/stream")
+async def submit_answer_stream(request: SubmitAnswerRequest):
+    """
+    Submit answer and stream the next question as Server-Sent Events
+    
+    Question text arrives as `data: {"text": ...}` frames while it is
+    generated, followed by one `event: evaluation` frame with the scored
+    answer and progress, then `data: [DONE]`.
+    """
+    session = await interview_manager.get_session(request.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    role = session.questions[0].category if session.questions else "Developer"  # Use stored role
+    experience_level = "mid"  # Use stored experience level
+    language = "english"  # Use stored language
+    max_questions = len(session.questions)
+    is_last_question = request.question_number >= max_questions
+    
+    # Save the answer before starting any paid LLM call
+    progress, _ = await interview_manager.submit_and_advance(
+        session_id=request.session_id,
+        transcript=request.transcript,
+        duration=request.duration,
+        confidence=request.confidence
+    )
+    if progress is None:
+        raise HTTPException(status_code=400, detail="Failed to submit answer")
+    
+    # Evaluate in the background while the question streams
+    evaluation_task = asyncio.create_task(ai_service.evaluate_answer_async(
+        role=role,
+        experience_level=experience_level,
+        language=language,
+        question=request.previous_question,
+        candidate_answer=request.transcript
+    ))
+    
+    question_chunks = None
+    if not is_last_question:
+        question_chunks = ai_service.stream_next_question(
+            role=role,
+            experience_level=experience_level,
+            language=language,
+            previous_question=request.previous_question,
+            question_number=request.question_number + 1,
+            max_questions=max_questions
+        )
+    
+    return StreamingResponse(
+        _submit_answer_events(evaluation_task, question_chunks, progress, is_last_question),
+        media_type="text/event-stream"
+    )
+
+
+async def _submit_answer_events(
+    evaluation_task: asyncio.Task,
+    question_chunks: Optional[AsyncIterator[str]],
+    progress: Dict,
+    is_last_question: bool
+) -> AsyncIterator[str]:
+    """Stream question chunks, then the evaluation frame, ending with [DONE]"""
+    try:
+        if question_chunks is not None:
+            async for chunk in question_chunks:
+                yield f"data: {orjson.dumps({'text': chunk}).decode()}\n\n"
+        
+        evaluation = await evaluation_task
+        payload = {
+            "evaluation": evaluation,
+            "progress": progress,
+            "interview_status": "COMPLETED" if is_last_question else "IN_PROGRESS"
+        }
+        yield f"event: evaluation\ndata: {orjson.dumps(payload).decode()}\n\n"
+    except Exception:
+        logger.exception("Answer stream failed")
+        yield f"event: error\ndata: {orjson.dumps({'detail': 'Failed to process answer'}).decode()}\n\n"
+    finally:
+        # Client disconnects close the generator; don't leave the evaluation running for nobody
+        if not evaluation_task.done():
+            evaluation_task.cancel()
+    yield "data: [DONE]\n\n"
+
+
 @router.post("/submit-audio")
 async def submit_audio_answer(
     session_id: str = Form(...),
@@ -193,26 +365,39 @@ async def submit_audio_answer(
     Submit audio recording for answer
     """
     try:
-        # Read audio data
-        audio_data = await audio.read()
-        
-        # Validate audio
-        is_valid, message = audio_processor.validate_audio_format(audio_data, audio.filename or "audio.webm")
+        # Validate format before touching the body
+        filename = audio.filename or "audio.webm"
+        is_valid, message = audio_processor.validate_audio_filename(filename)
         if not is_valid:
             raise HTTPException(status_code=400, detail=message)
         
-        # Analyze audio
-        quality = audio_processor.analyze_audio_quality(audio_data)
+        # Stream audio to disk chunk by chunk (in production, cloud storage)
+        safe_session_id = "".join(c for c in session_id if c.isalnum() or c in "_-")
+        file_ext = os.path.splitext(filename)[1].lower()
+        audio_url = os.path.join(AUDIO_UPLOAD_DIR, safe_session_id, f"q{question_id}{file_ext}")
+        try:
+            size = await anyio.to_thread.run_sync(
+                audio_processor.save_audio_stream,
+                audio.file,
+                audio_url,
+                limiter=audio_limiter
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # In production, save to cloud storage
-        audio_url = f"storage/interviews/{session_id}/q{question_id}.webm"
+        # Analyze audio
+        quality = await anyio.to_thread.run_sync(
+            audio_processor.analyze_audio_file,
+            audio_url,
+            limiter=audio_limiter
+        )
         
         return {
             "status": "success",
             "message": "Audio submitted successfully",
             "audio_url": audio_url,
             "quality": quality,
-            "size": len(audio_data)
+            "size": size
         }
     except HTTPException:
         raise
@@ -230,7 +415,7 @@ async def transcribe_audio(
     """
     try:
         # Transcribe using AI service
-        result = ai_service.transcribe_audio(audio.file, language)
+        result = await ai_service.transcribe_audio_async(audio.file, language)
         
         return {
             "status": "success",
@@ -245,203 +430,16 @@ async def transcribe_audio(
 
 
 @router.get("/progress/{session_id}")
-async def get_progress(session_id: str):
-    """
-    Get interview progress
-    """
-    progress = interview_manager.get_progress(session_id)
-    if not progress:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    return progress
-
-
-@router.post("/pause/{session_id}")
-async def pause_interview(session_id: str):
-    """
-    Pause interview session
-    """
-    success = interview_manager.pause_session(session_id)
-    if not success:
-        raise HTTPException(status_code=400, detail="Failed to pause session")
-    
-    return {
-        "status": "success",
-        "message": "Interview paused",
-        "session_id": session_id
-    }
-
-
-@router.post("/resume/{session_id}")
-async def resume_interview(session_id: str):
-    """
-    Resume paused interview
-    """
-    success = interview_manager.resume_session(session_id)
-    if not success:
-        raise HTTPException(status_code=400, detail="Failed to resume session")
-    
-    return {
-        "status": "success",
-        "message": "Interview resumed",
-        "session_id": session_id
-    }
-
-
-@router.post("/complete/{session_id}")
-async def complete_interview(session_id: str):
-    """
-    Complete interview and get summary
-    """
-    summary = interview_manager.complete_session(session_id)
-    if not summary:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    return {
-        "status": "success",
-        "message": "Interview completed successfully",
-        "summary": summary
-    }
-
-
-@router.get("/health")
-async def interview_health():
-    """
-    Check interview service health
-    """
-    return {
-        "status": "healthy",
-        "service": "interview",
-        "active_sessions": len(interview_manager.sessions),
-        "timestamp": datetime.now().isoformat(),
-        "features": [
-            "AI-powered questions",
-            "Real-time evaluation",
-            "Audio transcription",
-            "Multilingual support"
-        ]
-    }
-
-
-@router.get("/session/{session_id}")
-async def get_session(session_id: str):
-    """
-    Get interview session details
-    """
-    session = interview_manager.get_session(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    return {
-        "session_id": session.session_id,
-        "user_id": session.user_id,
-        "status": session.status,
-        "started_at": session.started_at.isoformat(),
-        "current_question": session.current_question,
-        "total_questions": len(session.questions),
-        "answered": len(session.answers),
-        "total_duration": session.total_duration
-    }
-
-
-@router.get("/question/{session_id}")
-async def get_current_question(session_id: str):
-    """
-    Get current question for session
-    """
-    question = interview_manager.get_current_question(session_id)
-    if not question:
-        raise HTTPException(status_code=404, detail="No current question or session not found")
-    
-    return {
-        "id": question.id,
-        "text": question.text,
-        "category": question.category,
-        "difficulty": question.difficulty,
-        "expected_duration": question.expected_duration
-    }
-
-
-@router.post("/submit-answer")
-async def submit_answer(request: SubmitAnswerRequest):
-    """
-    Submit answer for current question
-    """
-    success = interview_manager.submit_answer(
-        session_id=request.session_id,
-        transcript=request.transcript,
-        duration=request.duration,
-        confidence=request.confidence
-    )
-    
-    if not success:
-        raise HTTPException(status_code=400, detail="Failed to submit answer")
-    
-    # Get next question
-    next_question = interview_manager.get_next_question(request.session_id)
-    progress = interview_manager.get_progress(request.session_id)
-    
-    return {
-        "status": "success",
-        "message": "Answer submitted successfully",
-        "progress": progress,
-        "next_question": {
-            "id": next_question.id,
-            "text": next_question.text,
-            "category": next_question.category,
-            "expected_duration": next_question.expected_duration
-        } if next_question else None,
-        "interview_complete": progress.get("status") == "completed"
-    }
-
-
-@router.post("/submit-audio")
-async def submit_audio_answer(
-    session_id: str = Form(...),
-    question_id: int = Form(...),
-    audio: UploadFile = File(...)
-):
-    """
-    Submit audio recording for answer
-    """
-    try:
-        # Read audio data
-        audio_data = await audio.read()
-        
-        # Validate audio
-        is_valid, message = audio_processor.validate_audio_format(audio_data, audio.filename or "audio.webm")
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=message)
-        
-        # Analyze audio
-        quality = audio_processor.analyze_audio_quality(audio_data)
-        
-        # In production, save to cloud storage
-        audio_url = f"storage/interviews/{session_id}/q{question_id}.webm"
-        
-        return {
-            "status": "success",
-            "message": "Audio submitted successfully",
-            "audio_url": audio_url,
-            "quality": quality,
-            "size": len(audio_data)
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to process audio: {str(e)}")
-
-
-@router.get("/progress/{session_id}")
-async def get_progress(session_id: str):
+async def get_progress(session_id: str, request: Request):
     """
     Get interview progress
     """
-    progress = interview_manager.get_progress(session_id)
+    progress = await interview_manager.get_progress(session_id)
     if not progress:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return progress
+    etag = _etag(session_id, progress["status"], progress["answered"], progress["total_duration"])
+    return _conditional_response(request, etag, lambda: progress)
 
 
 @router.post("/pause/{session_id}")
@@ -449,7 +447,7 @@ async def pause_interview(session_id: str):
     """
     Pause interview session
     """
-    success = interview_manager.pause_session(session_id)
+    success = await interview_manager.pause_session(session_id)
     if not success:
         raise HTTPException(status_code=400, detail="Failed to pause session")
     
@@ -465,7 +463,7 @@ async def resume_interview(session_id: str):
     """
     Resume paused interview
     """
-    success = interview_manager.resume_session(session_id)
+    success = await interview_manager.resume_session(session_id)
     if not success:
         raise HTTPException(status_code=400, detail="Failed to resume session")
     
@@ -481,7 +479,7 @@ async def complete_interview(session_id: str):
     """
     Complete interview and get summary
     """
-    summary = interview_manager.complete_session(session_id)
+    summary = await interview_manager.complete_session(session_id)
     if not summary:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -500,6 +498,8 @@ async def interview_health():
     return {
         "status": "healthy",
         "service": "interview",
-        "active_sessions": len(interview_manager.sessions),
-        "timestamp": datetime.now().isoformat()
+        "active_sessions": await interview_manager.count_active_sessions(),
+        "ai_cache": ai_service.get_cache_stats(),
+        "timestamp": _health_iso_timestamp(),
+        "features": HEALTH_FEATURES
     }
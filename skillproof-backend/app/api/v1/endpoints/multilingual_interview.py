@@ -2,32 +2,99 @@
 Multilingual Interview API Endpoints
 Handles multilingual AI interviews in Indian languages
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict
+import orjson
 
+from app.config import get_settings
 from app.services.multilingual_interviewer import (
     multilingual_interviewer,
     InterviewRequest,
     InterviewResponse,
+    LanguageCode,
+    ExperienceLevel,
     SUPPORTED_LANGUAGES,
     LANGUAGE_NAMES
 )
+from app.utils.static_response import StaticJSON
 
 router = APIRouter()
 
+EXPERIENCE_LEVELS = [
+    {
+        "code": "junior",
+        "name": "Junior (0-2 years)",
+        "description": "Entry-level positions, basic technical questions"
+    },
+    {
+        "code": "mid",
+        "name": "Mid-Level (2-5 years)",
+        "description": "Intermediate positions, moderate complexity questions"
+    },
+    {
+        "code": "senior",
+        "name": "Senior (5+ years)",
+        "description": "Senior positions, advanced technical and architectural questions"
+    }
+]
+
+# Reference data is immutable: serialized once at import time and cacheable
+_LANGUAGES = StaticJSON({
+    "status": "success",
+    "languages": multilingual_interviewer.get_supported_languages(),
+    "total": len(SUPPORTED_LANGUAGES)
+})
+
+_LANGUAGE_INFO = {
+    code: StaticJSON({
+        "status": "success",
+        "data": {
+            "code": code,
+            "name": LANGUAGE_NAMES.get(code, code.capitalize()),
+            "native_name": LANGUAGE_NAMES.get(code, code.capitalize()),
+            "supported": True
+        }
+    })
+    for code in SUPPORTED_LANGUAGES
+}
+
+_EXPERIENCE_LEVELS = StaticJSON({
+    "status": "success",
+    "levels": EXPERIENCE_LEVELS
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "multilingual_interview",
+    "supported_languages": len(SUPPORTED_LANGUAGES),
+    "languages": SUPPORTED_LANGUAGES,
+    "features": [
+        "Multilingual interviews",
+        "AI-powered evaluation",
+        "Structured scoring",
+        "Real-time feedback",
+        "11 Indian languages supported"
+    ]
+})
+
 
 class StartInterviewRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     role: str
-    experience_level: str  # junior, mid, senior
-    language: str
+    experience_level: ExperienceLevel
+    language: LanguageCode
     max_questions: int = 5
 
 
 class SubmitAnswerRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     role: str
-    experience_level: str
-    language: str
+    experience_level: ExperienceLevel
+    language: LanguageCode
     max_questions: int
     question_number: int
     previous_question: str
@@ -35,18 +102,14 @@ class SubmitAnswerRequest(BaseModel):
 
 
 @router.get("/languages")
-async def get_supported_languages():
+async def get_supported_languages(request: Request):
     """
     Get list of supported interview languages
     
     Returns:
         List of supported languages with codes and names
     """
-    return {
-        "status": "success",
-        "languages": multilingual_interviewer.get_supported_languages(),
-        "total": len(SUPPORTED_LANGUAGES)
-    }
+    return _LANGUAGES.response(request)
 
 
 @router.post("/start")
@@ -61,15 +124,8 @@ async def start_multilingual_interview(request: StartInterviewRequest):
         First interview question in selected language
     """
     try:
-        # Validate language
-        if not multilingual_interviewer.validate_language(request.language):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported language: {request.language}. Supported: {', '.join(SUPPORTED_LANGUAGES)}"
-            )
-        
         # Generate first question
-        response = multilingual_interviewer.generate_first_question(
+        response = await multilingual_interviewer.generate_first_question(
             role=request.role,
             experience_level=request.experience_level,
             language=request.language,
@@ -107,15 +163,8 @@ async def submit_answer(request: SubmitAnswerRequest):
         Evaluation of answer and next question
     """
     try:
-        # Validate language
-        if not multilingual_interviewer.validate_language(request.language):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported language: {request.language}"
-            )
-        
         # Evaluate and get next question
-        response = multilingual_interviewer.evaluate_and_next_question(
+        response = await multilingual_interviewer.evaluate_and_next_question(
             role=request.role,
             experience_level=request.experience_level,
             language=request.language,
@@ -167,7 +216,7 @@ async def generate_custom_question(request: InterviewRequest):
         Generated question
     """
     try:
-        response = multilingual_interviewer.conduct_interview(request)
+        response = await multilingual_interviewer.conduct_interview(request)
         
         return {
             "status": "success",
@@ -185,7 +234,7 @@ async def generate_custom_question(request: InterviewRequest):
 
 
 @router.get("/language-info/{language_code}")
-async def get_language_info(language_code: str):
+async def get_language_info(language_code: str, request: Request):
     """
     Get information about a specific language
     
@@ -195,51 +244,25 @@ async def get_language_info(language_code: str):
     Returns:
         Language information
     """
-    if language_code.lower() not in SUPPORTED_LANGUAGES:
+    info = _LANGUAGE_INFO.get(language_code.lower())
+    if info is None:
         raise HTTPException(
             status_code=404,
             detail=f"Language not found: {language_code}"
         )
     
-    return {
-        "status": "success",
-        "data": {
-            "code": language_code.lower(),
-            "name": LANGUAGE_NAMES.get(language_code.lower(), language_code.capitalize()),
-            "native_name": LANGUAGE_NAMES.get(language_code.lower(), language_code.capitalize()),
-            "supported": True
-        }
-    }
+    return info.response(request)
 
 
 @router.get("/experience-levels")
-async def get_experience_levels():
+async def get_experience_levels(request: Request):
     """
     Get supported experience levels
     
     Returns:
         List of experience levels
     """
-    return {
-        "status": "success",
-        "levels": [
-            {
-                "code": "junior",
-                "name": "Junior (0-2 years)",
-                "description": "Entry-level positions, basic technical questions"
-            },
-            {
-                "code": "mid",
-                "name": "Mid-Level (2-5 years)",
-                "description": "Intermediate positions, moderate complexity questions"
-            },
-            {
-                "code": "senior",
-                "name": "Senior (5+ years)",
-                "description": "Senior positions, advanced technical and architectural questions"
-            }
-        ]
-    }
+    return _EXPERIENCE_LEVELS.response(request)
 
 
 @router.get("/health")
@@ -250,22 +273,9 @@ async def multilingual_interview_health():
     Returns:
         Service health status
     """
-    return {
-        "status": "healthy",
-        "service": "multilingual_interview",
-        "supported_languages": len(SUPPORTED_LANGUAGES),
-        "languages": SUPPORTED_LANGUAGES,
-        "features": [
-            "Multilingual interviews",
-            "AI-powered evaluation",
-            "Structured scoring",
-            "Real-time feedback",
-            "11 Indian languages supported"
-        ]
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@router.post("/test-prompt")
 async def test_prompt(request: InterviewRequest):
     """
     Test the AI prompt generation (for debugging)
@@ -292,3 +302,8 @@ async def test_prompt(request: InterviewRequest):
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# Debug-only: exposes full prompts, so it is kept out of the production route table
+if get_settings().ENABLE_DEBUG_ROUTES:
+    router.add_api_route("/test-prompt", test_prompt, methods=["POST"])
@@ -2,44 +2,176 @@
 Resume Upload and Parsing API Endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import BinaryIO, Dict, List
+import asyncio
+import hashlib
+import logging
 import os
-import uuid
-from datetime import datetime
+import secrets
+from datetime import datetime, timezone
+from functools import lru_cache
 
-from app.database import get_db
+import orjson
+import redis.asyncio as redis
+
+from app.config import get_settings
+from app.database import get_async_db
+from app.models.resume import ResumeFile
 from app.models.user import User
 from app.utils.security import get_current_user
-from app.ml.resume_parser import ResumeParser
-from app.ml.skill_extractor import SkillExtractor
+from app.ml.resume_parser import get_resume_parser
+from app.ml.skill_extractor import get_skill_extractor
+from app.services.object_storage import object_storage
+from app.utils.static_response import StaticJSON
 from app.schemas.resume import (
     ResumeUploadResponse,
+    PresignUploadRequest,
+    PresignUploadResponse,
+    ProcessUploadRequest,
+    ResumeBatchParseRequest,
     ResumeParseResponse,
     SkillMatchRequest,
     SkillMatchResponse
 )
 
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
-# Initialize AI modules
-resume_parser = ResumeParser()
-skill_extractor = SkillExtractor()
+# Skill extraction results keyed by resume text hash
+SKILL_CACHE_KEY_PREFIX = "skills:"
+# Parsed resumes keyed by file content hash
+RESUME_CACHE_KEY_PREFIX = "resume:"
+# Presigned upload keys mapped to the user they were issued to; an upload
+# must be processed within PENDING_UPLOAD_TTL_SECONDS of being presigned
+PENDING_UPLOAD_KEY_PREFIX = "resume-upload:"
+PENDING_UPLOAD_TTL_SECONDS = 3600
+skill_cache = redis.from_url(settings.REDIS_URL, decode_responses=True)
 
 # File upload configuration
 UPLOAD_DIR = "uploads/resumes"
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_REQUEST_SIZE = MAX_FILE_SIZE + 64 * 1024  # Allowance for multipart framing
+UPLOAD_CHUNK_SIZE = 64 * 1024
+S3_KEY_PREFIX = "resumes/"
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+def _save_upload(source: BinaryIO, destination: str) -> int:
+    """
+    Copy an uploaded file to disk in fixed-size chunks
+    
+    Args:
+        source: Readable binary file object
+        destination: Target file path
+        
+    Returns:
+        Number of bytes written
+        
+    Raises:
+        ValueError: If the file exceeds MAX_FILE_SIZE
+    """
+    size = 0
+    try:
+        with open(destination, "wb") as out:
+            while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise ValueError(f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB")
+                out.write(chunk)
+    except Exception:
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+    return size
+
+
+async def _cache_get(key: str):
+    """Read a cached JSON value; a cache outage counts as a miss, never an error"""
+    try:
+        cached = await skill_cache.get(key)
+    except Exception as e:
+        logger.warning(f"Resume cache read failed: {str(e)}")
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+async def _cache_set(key: str, value, ttl_seconds: int):
+    """Write a JSON value to the cache, ignoring cache outages"""
+    try:
+        await skill_cache.setex(key, ttl_seconds, orjson.dumps(value))
+    except Exception as e:
+        logger.warning(f"Resume cache write failed: {str(e)}")
+
+
+def _file_digest(file_path: str) -> str:
+    """BLAKE2b digest of a file's contents, read in chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def _parse_resume_cached(file_path: str) -> Dict:
+    """
+    Parse a resume file, served from Redis when identical bytes were parsed
+    before (candidates often re-upload the same resume for each job)
+    
+    Args:
+        file_path: Local path of the saved file
+        
+    Returns:
+        ResumeParser.parse_resume result
+    """
+    # The extension picks the parser, so it is part of the key
+    file_ext = os.path.splitext(file_path)[1].lower()
+    digest = await asyncio.to_thread(_file_digest, file_path)
+    cache_key = f"{RESUME_CACHE_KEY_PREFIX}{digest}{file_ext}"
+    
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Parsing is CPU-bound; keep it off the event loop
+    parsed_data = await asyncio.to_thread(get_resume_parser().parse_resume, file_path)
+    await _cache_set(cache_key, parsed_data, settings.RESUME_CACHE_TTL_SECONDS)
+    return parsed_data
+
+
+async def _extract_all_cached(text: str) -> Dict:
+    """
+    Extract skills and experience level, served from Redis when the same
+    resume text was analyzed before
+    
+    Args:
+        text: Raw resume text
+        
+    Returns:
+        Combined SkillExtractor.extract_all result
+    """
+    cache_key = SKILL_CACHE_KEY_PREFIX + hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    
+    cached = await _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result = await asyncio.to_thread(get_skill_extractor().extract_all, text)
+    await _cache_set(cache_key, result, settings.SKILL_CACHE_TTL_SECONDS)
+    return result
+
+
 @router.post("/upload", response_model=ResumeUploadResponse)
 async def upload_resume(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Upload and parse resume
@@ -59,36 +191,53 @@ async def upload_resume(
             detail=f"File type not supported. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # Validate file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / 1024 / 1024}MB"
-        )
-    
+    # Declared sizes over MAX_REQUEST_SIZE are rejected by SizeLimitMiddleware;
+    # the exact limit is enforced while saving
     # Generate unique filename
-    file_id = str(uuid.uuid4())
+    file_id = secrets.token_hex(16)
     filename = f"{file_id}{file_ext}"
     file_path = os.path.join(UPLOAD_DIR, filename)
     
-    # Save file
+    # Stream file to disk chunk by chunk
     try:
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        await asyncio.to_thread(_save_upload, file.file, file_path)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
     
+    return await _process_resume_file(db, current_user, file_id, file.filename, file_path)
+
+
+async def _process_resume_file(
+    db: AsyncSession,
+    user: User,
+    file_id: str,
+    filename: str,
+    file_path: str
+) -> Dict:
+    """
+    Parse a saved resume, record its owner and build the upload response
+    
+    Args:
+        db: Database session
+        user: Uploading user
+        file_id: Generated resume ID
+        filename: Original filename
+        file_path: Local path of the saved file
+        
+    Returns:
+        ResumeUploadResponse-shaped dictionary
+    """
     # Parse resume
     try:
-        parsed_data = resume_parser.parse_resume(file_path)
+        parsed_data = await _parse_resume_cached(file_path)
     except Exception as e:
         # Clean up file on error
         if os.path.exists(file_path):
@@ -98,18 +247,26 @@ async def upload_resume(
             detail=f"Failed to parse resume: {str(e)}"
         )
     
-    # Extract skills with advanced analysis
-    skill_data = skill_extractor.extract_skills(parsed_data.get('raw_text', ''))
+    # Extract skills and experience level in one pass
+    skill_data = await _extract_all_cached(parsed_data.get('raw_text', ''))
     
-    # Extract experience level
-    experience_data = skill_extractor.extract_experience_level(parsed_data.get('raw_text', ''))
+    # Record the stored path so deletes don't probe the filesystem
+    try:
+        db.add(ResumeFile(file_id=file_id, user_id=user.id, path=file_path))
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Resume already processed"
+        )
     
     # Combine all data
     result = {
         "file_id": file_id,
-        "filename": file.filename,
+        "filename": filename,
         "file_path": file_path,
-        "uploaded_at": datetime.utcnow().isoformat(),
+        "uploaded_at": datetime.now(timezone.utc).isoformat(),
         "parsed_data": {
             "name": parsed_data.get('name'),
             "email": parsed_data.get('email'),
@@ -119,9 +276,9 @@ async def upload_resume(
             "total_skills": skill_data['total_count'],
             "top_skills": skill_data['top_skills'],
             "skill_summary": skill_data['skill_summary'],
-            "years_of_experience": experience_data['years_of_experience'],
-            "seniority_level": experience_data['seniority_level'],
-            "experience_range": experience_data['experience_range']
+            "years_of_experience": skill_data['years_of_experience'],
+            "seniority_level": skill_data['seniority_level'],
+            "experience_range": skill_data['experience_range']
         },
         "parsing_accuracy": 85.0,
         "processing_time_ms": 1200
@@ -130,6 +287,111 @@ async def upload_resume(
     return result
 
 
+@router.post("/presign", response_model=PresignUploadResponse)
+async def presign_resume_upload(
+    request: PresignUploadRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a presigned S3 upload for a resume
+    
+    The client POSTs the file straight to S3 with the returned fields, then
+    calls /resume/process with the key. S3 enforces the size limit.
+    """
+    
+    file_ext = os.path.splitext(request.filename)[1].lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type not supported. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
+    
+    if not object_storage.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Direct uploads are not configured"
+        )
+    
+    file_id = secrets.token_hex(16)
+    key = f"{S3_KEY_PREFIX}{file_id}{file_ext}"
+    try:
+        upload = await asyncio.to_thread(object_storage.presign_upload, key, MAX_FILE_SIZE)
+        # Only the requesting user may process this key
+        await skill_cache.setex(PENDING_UPLOAD_KEY_PREFIX + key, PENDING_UPLOAD_TTL_SECONDS, str(current_user.id))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create upload: {str(e)}"
+        )
+    
+    return {**upload, "file_id": file_id}
+
+
+@router.post("/process", response_model=ResumeUploadResponse)
+async def process_uploaded_resume(
+    request: ProcessUploadRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Parse a resume previously uploaded to S3 via /resume/presign
+    
+    Only the user the key was issued to can process it, and only once.
+    """
+    
+    if not object_storage.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Direct uploads are not configured"
+        )
+    
+    # Only keys issued by /presign are accepted
+    filename = request.key[len(S3_KEY_PREFIX):]
+    file_id, file_ext = os.path.splitext(filename)
+    if (
+        not request.key.startswith(S3_KEY_PREFIX)
+        or file_ext.lower() not in ALLOWED_EXTENSIONS
+        or not all(c.isalnum() or c == "-" for c in file_id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid upload key"
+        )
+    
+    # Unlike the result caches, the ownership check must not fail open
+    try:
+        owner_id = await skill_cache.get(PENDING_UPLOAD_KEY_PREFIX + request.key)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to verify upload: {str(e)}"
+        )
+    if owner_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    if await db.get(ResumeFile, file_id) is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Resume already processed"
+        )
+    
+    file_path = os.path.join(UPLOAD_DIR, filename)
+    try:
+        await asyncio.to_thread(object_storage.download_to_file, request.key, file_path)
+    except Exception as e:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Uploaded file not found: {str(e)}"
+        )
+    
+    return await _process_resume_file(db, current_user, file_id, filename, file_path)
+
+
 @router.post("/parse", response_model=ResumeParseResponse)
 async def parse_resume_text(
     text: str,
@@ -139,19 +401,37 @@ async def parse_resume_text(
     Parse resume from text (for testing or direct input)
     """
     
-    # Extract skills
-    skill_data = skill_extractor.extract_skills(text)
+    # Extract skills and experience in one pass
+    skill_data = await _extract_all_cached(text)
     
-    # Extract experience
-    experience_data = skill_extractor.extract_experience_level(text)
+    return _parse_response(skill_data)
+
+
+@router.post("/parse-batch", response_model=List[ResumeParseResponse])
+async def parse_resume_texts(
+    request: ResumeBatchParseRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Parse many resume texts at once (bulk candidate import)
+    
+    Results are returned in request order.
+    """
     
+    results = await asyncio.to_thread(get_skill_extractor().extract_all_batch, request.texts)
+    
+    return [_parse_response(skill_data) for skill_data in results]
+
+
+def _parse_response(skill_data: Dict) -> Dict:
+    """Shape an extract_all result as a ResumeParseResponse"""
     return {
         "skills": skill_data['skills'],
         "categorized_skills": skill_data['categorized_skills'],
         "total_skills": skill_data['total_count'],
         "top_skills": skill_data['top_skills'],
-        "years_of_experience": experience_data['years_of_experience'],
-        "seniority_level": experience_data['seniority_level']
+        "years_of_experience": skill_data['years_of_experience'],
+        "seniority_level": skill_data['seniority_level']
     }
 
 
@@ -170,7 +450,7 @@ async def match_skills(
     - Hiring recommendation
     """
     
-    match_result = skill_extractor.match_skills(
+    match_result = get_skill_extractor().match_skills(
         candidate_skills=request.candidate_skills,
         required_skills=request.required_skills
     )
@@ -188,7 +468,7 @@ async def analyze_skill_proficiency(
     Analyze proficiency level for a specific skill
     """
     
-    proficiency = skill_extractor.analyze_skill_proficiency(resume_text, skill)
+    proficiency = get_skill_extractor().analyze_skill_proficiency(resume_text, skill)
     
     return {
         "skill": skill,
@@ -197,41 +477,54 @@ async def analyze_skill_proficiency(
     }
 
 
+@lru_cache(maxsize=1)
+def _supported_skills() -> StaticJSON:
+    """Serialize the skill taxonomy once, on first request"""
+    supported_skills = get_skill_extractor().supported_skills
+    return StaticJSON({
+        "categories": supported_skills,
+        "total_skills": sum(len(skills) for skills in supported_skills.values())
+    })
+
+
 @router.get("/supported-skills")
-async def get_supported_skills():
+async def get_supported_skills(request: Request):
     """
     Get list of all supported skills by category
     """
     
-    return {
-        "categories": skill_extractor.skill_database,
-        "total_skills": sum(len(skills) for skills in skill_extractor.skill_database.values())
-    }
+    return _supported_skills().response(request)
 
 
 @router.delete("/delete/{file_id}")
 async def delete_resume(
     file_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete uploaded resume file
     """
     
-    # Find file
-    for ext in ALLOWED_EXTENSIONS:
-        file_path = os.path.join(UPLOAD_DIR, f"{file_id}{ext}")
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                return {"message": "Resume deleted successfully", "file_id": file_id}
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to delete file: {str(e)}"
-                )
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Resume not found"
-    )
+    # Look up the stored path; other users' resumes are reported as missing
+    resume_file = await db.get(ResumeFile, file_id)
+    if resume_file is None or resume_file.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+    
+    try:
+        os.remove(resume_file.path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete file: {str(e)}"
+        )
+    
+    await db.delete(resume_file)
+    await db.commit()
+    
+    return {"message": "Resume deleted successfully", "file_id": file_id}
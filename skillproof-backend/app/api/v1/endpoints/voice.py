@@ -2,15 +2,37 @@
 Voice Interview Endpoints
 Handles audio processing, speech-to-text, and text-to-speech
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import AsyncIterator, List, Optional
+import asyncio
 import io
 import json
+import os
+
+import anyio
+import orjson
+
+from app.ml.whisper_transcriber import STREAM_SAMPLE_RATE, StreamingTranscription
+from app.services.ai_service import ai_service
+from app.services.audio_processor import audio_processor
+from app.services.object_storage import object_storage
+from app.utils.static_response import StaticJSON
 
 router = APIRouter()
 
+AUDIO_UPLOAD_DIR = "uploads/voice"
+AUDIO_S3_KEY_PREFIX = "interview-audio/"
+
+# Live transcription streams: chunked bodies carry no Content-Length, so the
+# length is capped while reading (PCM16 mono = 2 bytes per sample)
+STREAM_MAX_SECONDS = 600
+STREAM_MAX_BYTES = STREAM_MAX_SECONDS * STREAM_SAMPLE_RATE * 2
+# Dedicated threads for streaming Whisper passes, so live streams can't
+# exhaust the default pool shared by every other to_thread call
+stream_limiter = anyio.CapacityLimiter(os.cpu_count() or 4)
+
 
 class TextToSpeechRequest(BaseModel):
     text: str
@@ -32,6 +54,11 @@ class VoiceAnalysisResponse(BaseModel):
     clarity_score: float
 
 
+class PresignAudioRequest(BaseModel):
+    question_id: int
+    user_id: str
+
+
 @router.post("/text-to-speech")
 async def text_to_speech(request: TextToSpeechRequest):
     """
@@ -62,9 +89,6 @@ async def speech_to_text(
     Accepts audio file and returns transcript
     """
     try:
-        # Read audio file
-        audio_data = await audio.read()
-        
         # For now, return mock response
         # In production, integrate with Google Speech-to-Text, AWS Transcribe, or Whisper
         return SpeechToTextResponse(
@@ -76,6 +100,46 @@ async def speech_to_text(
         raise HTTPException(status_code=500, detail=f"STT error: {str(e)}")
 
 
+@router.post("/speech-to-text/stream")
+async def speech_to_text_stream(request: Request, language: str = "en-US"):
+    """
+    Transcribe live audio while it is still uploading
+    
+    The request body is raw mono PCM16 (little-endian) at 16kHz, sent with
+    chunked transfer encoding. Committed words are streamed back as NDJSON
+    lines: {"text": "...", "final": false}, ending with a "final": true line.
+    Audio beyond STREAM_MAX_SECONDS is not read; the final line is sent there.
+    """
+    transcriber = ai_service.whisper
+    if transcriber is None:
+        raise HTTPException(status_code=503, detail="Streaming transcription requires a local Whisper model")
+    
+    session = StreamingTranscription(transcriber, language.split("-")[0].lower())
+    return StreamingResponse(_transcription_events(request, session), media_type="application/x-ndjson")
+
+
+async def _transcription_events(request: Request, session: StreamingTranscription) -> AsyncIterator[bytes]:
+    """Feed request body chunks to the session and yield committed words"""
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > STREAM_MAX_BYTES:
+            break
+        session.append(chunk)
+        if session.ready():
+            words = await anyio.to_thread.run_sync(session.process, limiter=stream_limiter)
+            if words:
+                yield _transcript_line(words, final=False)
+    
+    words = await anyio.to_thread.run_sync(session.finish, limiter=stream_limiter)
+    yield _transcript_line(words, final=True)
+
+
+def _transcript_line(words: List[str], final: bool) -> bytes:
+    """Encode committed words as one NDJSON line"""
+    return orjson.dumps({"text": " ".join(words), "final": final}) + b"\n"
+
+
 @router.post("/analyze-audio", response_model=VoiceAnalysisResponse)
 async def analyze_audio(audio: UploadFile = File(...)):
     """
@@ -83,8 +147,6 @@ async def analyze_audio(audio: UploadFile = File(...)):
     Returns audio level, speaking detection, noise level
     """
     try:
-        audio_data = await audio.read()
-        
         # Mock analysis - in production, use audio processing libraries
         return VoiceAnalysisResponse(
             audio_level=0.75,
@@ -129,71 +191,115 @@ async def save_interview_audio(
     Save interview audio recording
     """
     try:
-        audio_data = await audio.read()
-        
         # In production, save to cloud storage (S3, Azure Blob, etc.)
-        filename = f"interview_{user_id}_q{question_id}.webm"
+        safe_user_id = "".join(c for c in user_id if c.isalnum() or c in "_-")
+        filename = f"interview_{safe_user_id}_q{question_id}.webm"
+        
+        # Stream to disk in chunks instead of buffering the whole upload
+        try:
+            size = await asyncio.to_thread(
+                audio_processor.save_audio_stream,
+                audio.file,
+                os.path.join(AUDIO_UPLOAD_DIR, filename)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         return {
             "status": "success",
             "message": "Audio saved successfully",
             "filename": filename,
-            "size": len(audio_data),
+            "size": size,
             "question_id": question_id
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Save error: {str(e)}")
 
 
+@router.post("/presign-interview-audio")
+async def presign_interview_audio(request: PresignAudioRequest):
+    """
+    Get a presigned S3 upload for an interview recording
+    
+    The client POSTs the recording straight to S3 instead of sending it
+    through /save-interview-audio.
+    """
+    if not object_storage.enabled:
+        raise HTTPException(status_code=503, detail="Direct uploads are not configured")
+    
+    safe_user_id = "".join(c for c in request.user_id if c.isalnum() or c in "_-")
+    filename = f"interview_{safe_user_id}_q{request.question_id}.webm"
+    
+    try:
+        upload = await asyncio.to_thread(
+            object_storage.presign_upload,
+            AUDIO_S3_KEY_PREFIX + filename,
+            audio_processor.MAX_AUDIO_SIZE,
+            "audio/webm"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Presign error: {str(e)}")
+    
+    return {**upload, "filename": filename, "question_id": request.question_id}
+
+
+# TTS voices and STT languages, serialized once
+_SUPPORTED_VOICES = StaticJSON({
+    "voices": [
+        {
+            "id": "en-US-Neural2-F",
+            "name": "Female US English",
+            "language": "en-US",
+            "gender": "female"
+        },
+        {
+            "id": "en-US-Neural2-M",
+            "name": "Male US English",
+            "language": "en-US",
+            "gender": "male"
+        },
+        {
+            "id": "en-GB-Neural2-F",
+            "name": "Female UK English",
+            "language": "en-GB",
+            "gender": "female"
+        },
+        {
+            "id": "en-IN-Neural2-F",
+            "name": "Female Indian English",
+            "language": "en-IN",
+            "gender": "female"
+        }
+    ]
+})
+
+_SUPPORTED_LANGUAGES = StaticJSON({
+    "languages": [
+        {"code": "en-US", "name": "English (US)"},
+        {"code": "en-GB", "name": "English (UK)"},
+        {"code": "en-IN", "name": "English (India)"},
+        {"code": "es-ES", "name": "Spanish (Spain)"},
+        {"code": "fr-FR", "name": "French (France)"},
+        {"code": "de-DE", "name": "German (Germany)"},
+        {"code": "hi-IN", "name": "Hindi (India)"},
+        {"code": "zh-CN", "name": "Chinese (Mandarin)"}
+    ]
+})
+
+
 @router.get("/supported-voices")
-async def get_supported_voices():
+async def get_supported_voices(request: Request):
     """
     Get list of available TTS voices
     """
-    return {
-        "voices": [
-            {
-                "id": "en-US-Neural2-F",
-                "name": "Female US English",
-                "language": "en-US",
-                "gender": "female"
-            },
-            {
-                "id": "en-US-Neural2-M",
-                "name": "Male US English",
-                "language": "en-US",
-                "gender": "male"
-            },
-            {
-                "id": "en-GB-Neural2-F",
-                "name": "Female UK English",
-                "language": "en-GB",
-                "gender": "female"
-            },
-            {
-                "id": "en-IN-Neural2-F",
-                "name": "Female Indian English",
-                "language": "en-IN",
-                "gender": "female"
-            }
-        ]
-    }
+    return _SUPPORTED_VOICES.response(request)
 
 
 @router.get("/supported-languages")
-async def get_supported_languages():
+async def get_supported_languages(request: Request):
     """
     Get list of supported languages for STT
     """
-    return {
-        "languages": [
-            {"code": "en-US", "name": "English (US)"},
-            {"code": "en-GB", "name": "English (UK)"},
-            {"code": "en-IN", "name": "English (India)"},
-            {"code": "es-ES", "name": "Spanish (Spain)"},
-            {"code": "fr-FR", "name": "French (France)"},
-            {"code": "de-DE", "name": "German (Germany)"},
-            {"code": "hi-IN", "name": "Hindi (India)"},
-            {"code": "zh-CN", "name": "Chinese (Mandarin)"}
-        ]
-    }
+    return _SUPPORTED_LANGUAGES.response(request)
@@ -1,18 +1,66 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from contextlib import asynccontextmanager
+import asyncio
 import time
 from app.config import get_settings
 from app.api.v1.router import api_router
+from app.api.v1.endpoints.resume import skill_cache, MAX_REQUEST_SIZE as RESUME_MAX_REQUEST_SIZE
+from app.ml.ai_client import get_ai_client, close_ai_client
+from app.ml.resume_parser import get_resume_parser
+from app.ml.skill_extractor import get_skill_extractor
+from app.services.ai_service import ai_service
+from app.services.audio_processor import audio_processor
+from app.utils.size_limit import SizeLimitMiddleware
+from app.database import async_engine
 
 settings = get_settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the shared AI client once so requests reuse it
+    app.state.ai_client = get_ai_client()
+    # Load the resume NLP pipeline before the first upload arrives
+    get_resume_parser()
+    get_skill_extractor()
+    # Warm first questions in the background so /start hits the cache
+    warm_task = None
+    if settings.FIRST_QUESTION_WARM_ROLES:
+        warm_task = asyncio.create_task(ai_service.warm_first_questions(
+            settings.FIRST_QUESTION_WARM_ROLES,
+            max_questions=settings.FIRST_QUESTION_WARM_MAX_QUESTIONS
+        ))
+    yield
+    if warm_task is not None:
+        warm_task.cancel()
+    # Release pooled upstream connections
+    await close_ai_client()
+    await ai_service.aclose()
+    await skill_cache.close()
+    await async_engine.dispose()
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Include API routes
+app.include_router(api_router, prefix="/api/v1")
+
+# Reject oversized uploads from Content-Length before the body is read.
+# Added before CORS so the 413 still carries CORS headers. Limited paths are
+# looked up from the registered routes, so prefix changes can't silently
+# disable them (url_path_for raises if the route disappears).
+app.add_middleware(
+    SizeLimitMiddleware,
+    max_body_size=audio_processor.MAX_AUDIO_SIZE + 64 * 1024,
+    path_limits={app.url_path_for("upload_resume"): RESUME_MAX_REQUEST_SIZE},
 )
 
 # CORS Configuration
@@ -33,13 +81,14 @@ async def log_requests(request: Request, call_next):
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
-# Include API routes
-app.include_router(api_router, prefix="/api/v1")
-
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": settings.VERSION}
+    return {
+        "status": "healthy",
+        "version": settings.VERSION,
+        "event_loop": type(asyncio.get_running_loop()).__module__
+    }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, loop="uvloop", http="httptools")
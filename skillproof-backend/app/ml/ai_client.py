@@ -2,15 +2,56 @@
 AI Client - Unified interface for multiple AI providers with automatic fallback
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator
+import asyncio
 import logging
+import random
+import threading
+import time
 from enum import Enum
 
+import httpx
+
 from app.utils.api_key_manager import MultiProviderKeyManager, AIProvider
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Exponential backoff between keys after rate limits and server errors
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+# Prompt templates; static instructions are built once, only the fields are formatted per call
+INTERVIEW_QUESTION_PROMPT = """
+        You are an AI interviewer. Generate a relevant interview question.
+        
+        Job Description: {job_description}
+        Candidate Background: {candidate_background}
+        Question Number: {question_number}
+        
+        Generate a thoughtful, relevant interview question that:
+        1. Relates to the job requirements
+        2. Assesses the candidate's skills and experience
+        3. Is clear and professional
+        4. Encourages detailed responses
+        
+        Return only the question, nothing else.
+        """
+
+ANSWER_ANALYSIS_PROMPT = """
+        Analyze this interview answer and provide a score and feedback.
+        
+        Question: {question}
+        Answer: {answer}
+        Job Requirements: {job_requirements}
+        
+        Provide analysis in this format:
+        Score: [0-10]
+        Strengths: [bullet points]
+        Areas for Improvement: [bullet points]
+        Overall Assessment: [brief summary]
+        """
+
 
 class AIClientError(Exception):
     """Base exception for AI client errors"""
@@ -42,23 +83,38 @@ class AIClient:
         self.model = self.settings.AI_MODEL
         self.temperature = self.settings.AI_TEMPERATURE
         self.max_tokens = self.settings.AI_MAX_TOKENS
+        
+        # Shared connection pool so upstream calls reuse TCP/TLS connections
+        self.http_client = httpx.Client(
+            timeout=60,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        self._sdk_clients: Dict[tuple, Any] = {}
+        self._sdk_lock = threading.Lock()
+        
+        # Async counterparts for callers running on the event loop
+        self.async_http_client = httpx.AsyncClient(
+            timeout=60,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        self._async_sdk_clients: Dict[tuple, Any] = {}
     
     def _load_api_keys(self):
         """Load API keys from settings"""
         # OpenAI
-        openai_keys = self.settings.get_openai_keys()
+        openai_keys = self.settings.openai_keys
         if openai_keys:
             self.key_manager.add_provider(AIProvider.OPENAI, openai_keys)
             logger.info(f"Loaded {len(openai_keys)} OpenAI API keys")
         
         # Gemini
-        gemini_keys = self.settings.get_gemini_keys()
+        gemini_keys = self.settings.gemini_keys
         if gemini_keys:
             self.key_manager.add_provider(AIProvider.GEMINI, gemini_keys)
             logger.info(f"Loaded {len(gemini_keys)} Gemini API keys")
         
         # Anthropic
-        anthropic_keys = self.settings.get_anthropic_keys()
+        anthropic_keys = self.settings.anthropic_keys
         if anthropic_keys:
             self.key_manager.add_provider(AIProvider.ANTHROPIC, anthropic_keys)
             logger.info(f"Loaded {len(anthropic_keys)} Anthropic API keys")
@@ -66,6 +122,67 @@ class AIClient:
         if not self.key_manager.get_available_providers():
             logger.warning("No AI API keys configured!")
     
+    def _get_sdk_client(self, provider: AIProvider, api_key: str) -> Any:
+        """
+        Get a cached SDK client for a provider key, bound to the shared pool
+        
+        Args:
+            provider: AI provider (OpenAI or Anthropic)
+            api_key: Provider API key
+            
+        Returns:
+            SDK client instance
+        """
+        cache_key = (provider, api_key)
+        client = self._sdk_clients.get(cache_key)
+        if client is not None:
+            return client
+        
+        with self._sdk_lock:
+            client = self._sdk_clients.get(cache_key)
+            if client is None:
+                # Import here to avoid dependency issues
+                if provider == AIProvider.OPENAI:
+                    import openai
+                    client = openai.OpenAI(api_key=api_key, http_client=self.http_client)
+                else:
+                    import anthropic
+                    client = anthropic.Anthropic(api_key=api_key, http_client=self.http_client)
+                self._sdk_clients[cache_key] = client
+        return client
+    
+    def _get_async_sdk_client(self, provider: AIProvider, api_key: str) -> Any:
+        """
+        Get a cached async SDK client for a provider key, bound to the shared async pool
+        
+        Args:
+            provider: AI provider (OpenAI or Anthropic)
+            api_key: Provider API key
+            
+        Returns:
+            Async SDK client instance
+        """
+        cache_key = (provider, api_key)
+        client = self._async_sdk_clients.get(cache_key)
+        if client is None:
+            # Import here to avoid dependency issues
+            if provider == AIProvider.OPENAI:
+                import openai
+                client = openai.AsyncOpenAI(api_key=api_key, http_client=self.async_http_client)
+            else:
+                import anthropic
+                client = anthropic.AsyncAnthropic(api_key=api_key, http_client=self.async_http_client)
+            self._async_sdk_clients[cache_key] = client
+        return client
+    
+    def close(self):
+        """Release pooled connections"""
+        self.http_client.close()
+    
+    async def aclose(self):
+        """Release pooled async connections"""
+        await self.async_http_client.aclose()
+    
     def generate_text(
         self,
         prompt: str,
@@ -73,6 +190,7 @@ class AIClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
     ) -> str:
         """
         Generate text using AI with automatic fallback.
@@ -83,6 +201,7 @@ class AIClient:
             model: Model name (optional)
             temperature: Temperature setting (optional)
             max_tokens: Max tokens (optional)
+            system_prompt: System instructions (optional)
             
         Returns:
             str: Generated text
@@ -104,20 +223,260 @@ class AIClient:
         # Try all keys for the provider
         all_keys = self.key_manager.get_all_keys_for_provider(used_provider)
         
+        for attempt, key in enumerate(all_keys):
+            try:
+                if used_provider == AIProvider.OPENAI:
+                    text = self._call_openai(key, prompt, model, temperature, max_tokens, system_prompt)
+                elif used_provider == AIProvider.GEMINI:
+                    text = self._call_gemini(key, prompt, model, temperature, max_tokens, system_prompt)
+                else:
+                    text = self._call_anthropic(key, prompt, model, temperature, max_tokens, system_prompt)
+            except Exception as e:
+                logger.warning(f"Failed with {used_provider} key: {str(e)}")
+                if self._handle_failure(used_provider, key, e) and attempt < len(all_keys) - 1:
+                    time.sleep(self._backoff_delay(attempt))
+                continue
+            
+            self.key_manager.record_success(used_provider, key)
+            return text
+        
+        raise AIClientError(f"All API keys failed for {used_provider}")
+    
+    async def generate_text_async(
+        self,
+        prompt: str,
+        provider: Optional[AIProvider] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """
+        Generate text on the event loop using async provider clients.
+        
+        Same fallback and key rotation as generate_text.
+        
+        Args:
+            prompt: Input prompt
+            provider: Preferred AI provider (optional)
+            model: Model name (optional)
+            temperature: Temperature setting (optional)
+            max_tokens: Max tokens (optional)
+            system_prompt: System instructions (optional)
+            
+        Returns:
+            str: Generated text
+            
+        Raises:
+            AIClientError: If all providers and keys fail
+        """
+        provider = provider or self.default_provider
+        model = model or self.model
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        
+        api_key, used_provider = self.key_manager.get_key_with_fallback(provider)
+        
+        if not api_key:
+            raise AIClientError("No API keys available for any provider")
+        
+        all_keys = self.key_manager.get_all_keys_for_provider(used_provider)
+        # Start from the round-robin key so concurrent calls spread across keys
+        if api_key in all_keys:
+            start = all_keys.index(api_key)
+            all_keys = all_keys[start:] + all_keys[:start]
+        
+        for attempt, key in enumerate(all_keys):
+            try:
+                if used_provider == AIProvider.OPENAI:
+                    text = await self._call_openai_async(key, prompt, model, temperature, max_tokens, system_prompt)
+                elif used_provider == AIProvider.GEMINI:
+                    text = await self._call_gemini_async(key, prompt, model, temperature, max_tokens, system_prompt)
+                else:
+                    text = await self._call_anthropic_async(key, prompt, model, temperature, max_tokens, system_prompt)
+            except Exception as e:
+                logger.warning(f"Failed with {used_provider} key: {str(e)}")
+                if self._handle_failure(used_provider, key, e) and attempt < len(all_keys) - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+            
+            self.key_manager.record_success(used_provider, key)
+            return text
+        
+        raise AIClientError(f"All API keys failed for {used_provider}")
+    
+    def _handle_failure(self, provider: AIProvider, key: str, error: Exception) -> bool:
+        """
+        Classify a provider error and update key/circuit state
+        
+        Args:
+            provider: AI provider that failed
+            key: API key used for the call
+            error: Raised exception
+            
+        Returns:
+            bool: True if the error is transient and the next attempt should back off
+            
+        Raises:
+            AIClientError: If the request itself was rejected, so other keys would fail too
+        """
+        # openai/anthropic expose status_code, google api_core exposes code
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        if not isinstance(status, int):
+            status = None
+        
+        if status in (401, 403):
+            # Dead or revoked key: sit it out instead of retrying it every request
+            self.key_manager.mark_key_failed(provider, key)
+            return False
+        
+        if status is None or status == 429 or status >= 500:
+            # Rate limit, outage or network error
+            self.key_manager.record_failure(provider)
+            return True
+        
+        raise AIClientError(f"{provider} rejected the request: {str(error)}") from error
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter for the given retry attempt"""
+        return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, RETRY_BASE_DELAY)
+    
+    async def stream_text_async(
+        self,
+        prompt: str,
+        provider: Optional[AIProvider] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text chunks on the event loop using async provider clients.
+        
+        Keys are rotated only until the first chunk arrives; a failure after
+        that point is raised because the partial output is already sent.
+        
+        Args:
+            prompt: Input prompt
+            provider: Preferred AI provider (optional)
+            model: Model name (optional)
+            temperature: Temperature setting (optional)
+            max_tokens: Max tokens (optional)
+            
+        Yields:
+            str: Generated text chunks
+            
+        Raises:
+            AIClientError: If all providers and keys fail
+        """
+        provider = provider or self.default_provider
+        model = model or self.model
+        temperature = temperature or self.temperature
+        max_tokens = max_tokens or self.max_tokens
+        
+        api_key, used_provider = self.key_manager.get_key_with_fallback(provider)
+        
+        if not api_key:
+            raise AIClientError("No API keys available for any provider")
+        
+        all_keys = self.key_manager.get_all_keys_for_provider(used_provider)
+        
         for key in all_keys:
+            started = False
             try:
                 if used_provider == AIProvider.OPENAI:
-                    return self._call_openai(key, prompt, model, temperature, max_tokens)
+                    chunks = self._stream_openai_async(key, prompt, model, temperature, max_tokens)
                 elif used_provider == AIProvider.GEMINI:
-                    return self._call_gemini(key, prompt, model, temperature, max_tokens)
-                elif used_provider == AIProvider.ANTHROPIC:
-                    return self._call_anthropic(key, prompt, model, temperature, max_tokens)
+                    chunks = self._stream_gemini_async(key, prompt, model, temperature, max_tokens)
+                else:
+                    chunks = self._stream_anthropic_async(key, prompt, model, temperature, max_tokens)
+                
+                async for chunk in chunks:
+                    started = True
+                    yield chunk
+                return
             except Exception as e:
+                if started:
+                    raise AIClientError(f"Stream interrupted for {used_provider}: {str(e)}") from e
                 logger.warning(f"Failed with {used_provider} key: {str(e)}")
                 continue
         
         raise AIClientError(f"All API keys failed for {used_provider}")
     
+    async def _stream_openai_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Stream OpenAI chat completion deltas with the async client"""
+        client = self._get_async_sdk_client(AIProvider.OPENAI, api_key)
+        
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        
+        async for event in stream:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+    
+    async def _stream_gemini_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Stream Gemini content chunks with the async client"""
+        # Import here to avoid dependency issues
+        import google.generativeai as genai
+        
+        genai.configure(api_key=api_key)
+        model_instance = genai.GenerativeModel(model or 'gemini-pro')
+        
+        response = await model_instance.generate_content_async(
+            prompt,
+            generation_config={
+                'temperature': temperature,
+                'max_output_tokens': max_tokens,
+            },
+            stream=True,
+        )
+        
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+    
+    async def _stream_anthropic_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Stream Anthropic message text deltas with the async client"""
+        client = self._get_async_sdk_client(AIProvider.ANTHROPIC, api_key)
+        
+        stream = await client.messages.create(
+            model=model or "claude-3-sonnet-20240229",
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+        )
+        
+        async for event in stream:
+            if event.type == "content_block_delta" and event.delta.text:
+                yield event.delta.text
+    
     def _call_openai(
         self,
         api_key: str,
@@ -125,6 +484,7 @@ class AIClient:
         model: str,
         temperature: float,
         max_tokens: int,
+        system_prompt: Optional[str] = None,
     ) -> str:
         """
         Call OpenAI API
@@ -135,19 +495,21 @@ class AIClient:
             model: Model name
             temperature: Temperature
             max_tokens: Max tokens
+            system_prompt: System instructions (optional)
             
         Returns:
             str: Generated text
         """
         try:
-            # Import here to avoid dependency issues
-            import openai
+            client = self._get_sdk_client(AIProvider.OPENAI, api_key)
             
-            client = openai.OpenAI(api_key=api_key)
+            messages = [{"role": "user", "content": prompt}]
+            if system_prompt:
+                messages.insert(0, {"role": "system", "content": system_prompt})
             
             response = client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
@@ -165,6 +527,7 @@ class AIClient:
         model: str,
         temperature: float,
         max_tokens: int,
+        system_prompt: Optional[str] = None,
     ) -> str:
         """
         Call Gemini API
@@ -175,6 +538,7 @@ class AIClient:
             model: Model name
             temperature: Temperature
             max_tokens: Max tokens
+            system_prompt: System instructions (optional)
             
         Returns:
             str: Generated text
@@ -186,6 +550,10 @@ class AIClient:
             genai.configure(api_key=api_key)
             model_instance = genai.GenerativeModel(model or 'gemini-pro')
             
+            # gemini-pro has no system role; prepend instructions instead
+            if system_prompt:
+                prompt = f"{system_prompt}\n\n{prompt}"
+            
             response = model_instance.generate_content(
                 prompt,
                 generation_config={
@@ -207,6 +575,7 @@ class AIClient:
         model: str,
         temperature: float,
         max_tokens: int,
+        system_prompt: Optional[str] = None,
     ) -> str:
         """
         Call Anthropic API
@@ -217,21 +586,116 @@ class AIClient:
             model: Model name
             temperature: Temperature
             max_tokens: Max tokens
+            system_prompt: System instructions (optional)
             
         Returns:
             str: Generated text
         """
         try:
-            # Import here to avoid dependency issues
-            import anthropic
+            client = self._get_sdk_client(AIProvider.ANTHROPIC, api_key)
             
-            client = anthropic.Anthropic(api_key=api_key)
+            extra = {"system": system_prompt} if system_prompt else {}
             
             response = client.messages.create(
                 model=model or "claude-3-sonnet-20240229",
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                **extra
+            )
+            
+            return response.content[0].text
+        
+        except Exception as e:
+            logger.error(f"Anthropic API error: {str(e)}")
+            raise
+    
+    async def _call_openai_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Call OpenAI API with the async client"""
+        try:
+            client = self._get_async_sdk_client(AIProvider.OPENAI, api_key)
+            
+            messages = [{"role": "user", "content": prompt}]
+            if system_prompt:
+                messages.insert(0, {"role": "system", "content": system_prompt})
+            
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            
+            return response.choices[0].message.content
+        
+        except Exception as e:
+            logger.error(f"OpenAI API error: {str(e)}")
+            raise
+    
+    async def _call_gemini_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Call Gemini API with the async client"""
+        try:
+            # Import here to avoid dependency issues
+            import google.generativeai as genai
+            
+            genai.configure(api_key=api_key)
+            model_instance = genai.GenerativeModel(model or 'gemini-pro')
+            
+            # gemini-pro has no system role; prepend instructions instead
+            if system_prompt:
+                prompt = f"{system_prompt}\n\n{prompt}"
+            
+            response = await model_instance.generate_content_async(
+                prompt,
+                generation_config={
+                    'temperature': temperature,
+                    'max_output_tokens': max_tokens,
+                }
+            )
+            
+            return response.text
+        
+        except Exception as e:
+            logger.error(f"Gemini API error: {str(e)}")
+            raise
+    
+    async def _call_anthropic_async(
+        self,
+        api_key: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Call Anthropic API with the async client"""
+        try:
+            client = self._get_async_sdk_client(AIProvider.ANTHROPIC, api_key)
+            
+            extra = {"system": system_prompt} if system_prompt else {}
+            
+            response = await client.messages.create(
+                model=model or "claude-3-sonnet-20240229",
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}],
+                **extra
             )
             
             return response.content[0].text
@@ -257,23 +721,61 @@ class AIClient:
         Returns:
             str: Generated interview question
         """
-        prompt = f"""
-        You are an AI interviewer. Generate a relevant interview question.
-        
-        Job Description: {job_description}
-        Candidate Background: {candidate_background}
-        Question Number: {question_number}
-        
-        Generate a thoughtful, relevant interview question that:
-        1. Relates to the job requirements
-        2. Assesses the candidate's skills and experience
-        3. Is clear and professional
-        4. Encourages detailed responses
+        prompt = self._interview_question_prompt(job_description, candidate_background, question_number)
+        return self.generate_text(prompt, max_tokens=200)
+    
+    async def generate_interview_question_async(
+        self,
+        job_description: str,
+        candidate_background: str,
+        question_number: int,
+    ) -> str:
+        """
+        Async variant of generate_interview_question for request handlers.
         
-        Return only the question, nothing else.
+        Args:
+            job_description: Job description
+            candidate_background: Candidate's background
+            question_number: Question number (1-5)
+            
+        Returns:
+            str: Generated interview question
         """
+        prompt = self._interview_question_prompt(job_description, candidate_background, question_number)
+        return await self.generate_text_async(prompt, max_tokens=200)
+    
+    def stream_interview_question(
+        self,
+        job_description: str,
+        candidate_background: str,
+        question_number: int,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an interview question as it is generated.
         
-        return self.generate_text(prompt, max_tokens=200)
+        Args:
+            job_description: Job description
+            candidate_background: Candidate's background
+            question_number: Question number (1-5)
+            
+        Yields:
+            str: Question text chunks
+        """
+        prompt = self._interview_question_prompt(job_description, candidate_background, question_number)
+        return self.stream_text_async(prompt, max_tokens=200)
+    
+    def _interview_question_prompt(
+        self,
+        job_description: str,
+        candidate_background: str,
+        question_number: int,
+    ) -> str:
+        """Build the prompt for interview question generation"""
+        return INTERVIEW_QUESTION_PROMPT.format(
+            job_description=job_description,
+            candidate_background=candidate_background,
+            question_number=question_number,
+        )
     
     def analyze_interview_answer(
         self,
@@ -292,29 +794,75 @@ class AIClient:
         Returns:
             Dict: Analysis results with score and feedback
         """
-        prompt = f"""
-        Analyze this interview answer and provide a score and feedback.
-        
-        Question: {question}
-        Answer: {answer}
-        Job Requirements: {job_requirements}
+        prompt = self._answer_analysis_prompt(question, answer, job_requirements)
+        analysis = self.generate_text(prompt, max_tokens=500)
         
-        Provide analysis in this format:
-        Score: [0-10]
-        Strengths: [bullet points]
-        Areas for Improvement: [bullet points]
-        Overall Assessment: [brief summary]
+        # Parse the response (simplified)
+        return {
+            "raw_analysis": analysis,
+            "question": question,
+            "answer": answer,
+        }
+    
+    async def analyze_interview_answer_async(
+        self,
+        question: str,
+        answer: str,
+        job_requirements: str,
+    ) -> Dict[str, Any]:
         """
+        Async variant of analyze_interview_answer for request handlers.
         
-        analysis = self.generate_text(prompt, max_tokens=500)
+        Args:
+            question: Interview question
+            answer: Candidate's answer
+            job_requirements: Job requirements
+            
+        Returns:
+            Dict: Analysis results with score and feedback
+        """
+        prompt = self._answer_analysis_prompt(question, answer, job_requirements)
+        analysis = await self.generate_text_async(prompt, max_tokens=500)
         
-        # Parse the response (simplified)
         return {
             "raw_analysis": analysis,
             "question": question,
             "answer": answer,
         }
     
+    def stream_interview_answer_analysis(
+        self,
+        question: str,
+        answer: str,
+        job_requirements: str,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the raw analysis of a candidate's answer as it is generated.
+        
+        Args:
+            question: Interview question
+            answer: Candidate's answer
+            job_requirements: Job requirements
+            
+        Yields:
+            str: Analysis text chunks
+        """
+        prompt = self._answer_analysis_prompt(question, answer, job_requirements)
+        return self.stream_text_async(prompt, max_tokens=500)
+    
+    def _answer_analysis_prompt(
+        self,
+        question: str,
+        answer: str,
+        job_requirements: str,
+    ) -> str:
+        """Build the prompt for interview answer analysis"""
+        return ANSWER_ANALYSIS_PROMPT.format(
+            question=question,
+            answer=answer,
+            job_requirements=job_requirements,
+        )
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get AI client status
@@ -332,6 +880,7 @@ class AIClient:
 
 # Singleton instance
 _ai_client: Optional[AIClient] = None
+_ai_client_lock = threading.Lock()
 
 
 def get_ai_client() -> AIClient:
@@ -343,5 +892,16 @@ def get_ai_client() -> AIClient:
     """
     global _ai_client
     if _ai_client is None:
-        _ai_client = AIClient()
+        with _ai_client_lock:
+            if _ai_client is None:
+                _ai_client = AIClient()
     return _ai_client
+
+
+async def close_ai_client():
+    """Close the singleton AI client if it was created"""
+    global _ai_client
+    if _ai_client is not None:
+        _ai_client.close()
+        await _ai_client.aclose()
+        _ai_client = None
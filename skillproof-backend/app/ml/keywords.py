@@ -0,0 +1,58 @@
+"""
+Whole-word keyword matching with a single Aho-Corasick pass
+
+One automaton handles single- and multi-word keywords alike. Tokenizing
+into a set would need its own rules for names like "c++", "node.js" and
+"ci/cd", would still need a second matcher for phrases, and would lose the
+per-occurrence positions and counts that skill scoring uses.
+"""
+
+from typing import Iterable, Iterator, Tuple
+
+import ahocorasick
+
+
+def build_automaton(keywords: Iterable[str]) -> ahocorasick.Automaton:
+    """
+    Build a matcher for a fixed set of lowercase keywords
+
+    Args:
+        keywords: Keywords to match; each one is also the match value
+
+    Returns:
+        Automaton ready for iter_keywords
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def iter_keywords(automaton: ahocorasick.Automaton, text_lower: str) -> Iterator[str]:
+    """
+    Yield each whole-word keyword occurrence in text_lower
+
+    Matches inside a longer word are skipped ("java" not in "javascript").
+    """
+    for _, keyword in iter_keyword_spans(automaton, text_lower):
+        yield keyword
+
+
+def iter_keyword_spans(
+    automaton: ahocorasick.Automaton, text_lower: str
+) -> Iterator[Tuple[int, str]]:
+    """Like iter_keywords, but yield (start offset, keyword) pairs"""
+    length = len(text_lower)
+    for end, keyword in automaton.iter(text_lower):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end + 1 < length and _is_word_char(text_lower[end + 1]):
+            continue
+        yield start, keyword
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character"""
+    return char.isalnum() or char == '_'
@@ -0,0 +1,25 @@
+"""
+Shared spaCy pipeline for resume NLP
+"""
+
+from functools import lru_cache
+
+import spacy
+
+# Only named entities are used; skip the pipes that don't feed NER
+DISABLED_PIPES = ["parser", "tagger", "lemmatizer", "attribute_ruler"]
+
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Load the spaCy English model once per process
+
+    Returns:
+        spaCy Language, or None if the model isn't installed
+    """
+    try:
+        return spacy.load("en_core_web_sm", disable=DISABLED_PIPES)
+    except Exception:
+        # Fallback if spaCy model not installed
+        return None
@@ -1,24 +1,60 @@
 import re
-from typing import Dict, List
-import spacy
+from functools import lru_cache
+from typing import Dict, Iterator, List
 from PyPDF2 import PdfReader
 from docx import Document
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # PDFium wheel unavailable; fall back to pure-Python PyPDF2
+    pdfium = None
+
+from app.ml.keywords import build_automaton, iter_keywords
+from app.ml.nlp import get_nlp
+
 class ResumeParser:
+    # Patterns are compiled once at class load
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+    # Branches are listed by priority; each captures the year count
+    EXPERIENCE_PATTERN = re.compile(
+        r'(\d+)\+?\s*years?\s*of\s*experience'
+        r'|experience\s*:\s*(\d+)\+?\s*years?'
+        r'|(\d+)\+?\s*yrs?\s*experience'
+    )
+    
+    # Common tech skills
+    SKILL_KEYWORDS = (
+        'python', 'java', 'javascript', 'typescript', 'react', 'angular', 'vue',
+        'node.js', 'django', 'flask', 'fastapi', 'sql', 'postgresql', 'mongodb',
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'ci/cd',
+        'machine learning', 'deep learning', 'nlp', 'computer vision',
+        'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy'
+    )
+    
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            # Fallback if spaCy model not installed
-            self.nlp = None
+        self.nlp = get_nlp()
+        self.skill_automaton = build_automaton(self.SKILL_KEYWORDS)
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
+    def iter_pdf_pages(self, file_path: str) -> Iterator[str]:
+        """Yield the text of each PDF page in order"""
+        if pdfium is not None:
+            # PDFium's C++ extractor is much faster than PyPDF2 on long resumes
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    yield page.get_textpage().get_text_range().replace("\r\n", "\n")
+            finally:
+                pdf.close()
+            return
+        
         reader = PdfReader(file_path)
-        text = ""
         for page in reader.pages:
-            text += page.extract_text()
-        return text
+            yield page.extract_text()
+    
+    def extract_text_from_pdf(self, file_path: str) -> str:
+        """Extract text from PDF file"""
+        return "\n".join(self.iter_pdf_pages(file_path))
     
     def extract_text_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
@@ -28,15 +64,14 @@ class ResumeParser:
     
     def extract_email(self, text: str) -> str:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = self.EMAIL_PATTERN.findall(text)
         return emails[0] if emails else None
     
     def extract_phone(self, text: str) -> str:
         """Extract phone number"""
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
-        return phones[0] if phones else None
+        # search, not findall: findall would return the country-code group
+        match = self.PHONE_PATTERN.search(text)
+        return match.group(0) if match else None
     
     def extract_name(self, text: str) -> str:
         """Extract name from resume (first few lines)"""
@@ -51,22 +86,15 @@ class ResumeParser:
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills using NLP and keyword matching"""
-        # Common tech skills
-        skill_keywords = [
-            'python', 'java', 'javascript', 'typescript', 'react', 'angular', 'vue',
-            'node.js', 'django', 'flask', 'fastapi', 'sql', 'postgresql', 'mongodb',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'ci/cd',
-            'machine learning', 'deep learning', 'nlp', 'computer vision',
-            'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy'
+        return self._extract_skills(text, text.lower())
+    
+    def _extract_skills(self, text: str, text_lower: str) -> List[str]:
+        """Skill extraction with the lowercased text supplied by the caller"""
+        # One pass over the text finds every whole-word keyword
+        found_skills = [
+            skill.title() for skill in iter_keywords(self.skill_automaton, text_lower)
         ]
         
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill.title())
-        
         # Use spaCy for entity extraction if available
         if self.nlp:
             doc = self.nlp(text)
@@ -78,17 +106,19 @@ class ResumeParser:
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'experience\s*:\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*experience'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                return int(matches[0])
+        return self._extract_experience_years(text.lower())
+    
+    def _extract_experience_years(self, text_lower: str) -> int:
+        """Experience extraction over pre-lowercased text"""
+        # One scan; keep the earliest match of the highest-priority branch
+        first_by_branch = {}
+        for match in self.EXPERIENCE_PATTERN.finditer(text_lower):
+            first_by_branch.setdefault(match.lastindex, match.group(match.lastindex))
+            if match.lastindex == 1:
+                break
         
+        if first_by_branch:
+            return int(first_by_branch[min(first_by_branch)])
         return 0
     
     def parse_resume(self, file_path: str) -> Dict:
@@ -101,14 +131,23 @@ class ResumeParser:
         else:
             raise ValueError("Unsupported file format")
         
+        # Lowercase once for every case-insensitive extractor
+        text_lower = text.lower()
+        
         # Extract information
         parsed_data = {
             "name": self.extract_name(text),
             "email": self.extract_email(text),
             "phone": self.extract_phone(text),
-            "skills": self.extract_skills(text),
-            "years_of_experience": self.extract_experience_years(text),
+            "skills": self._extract_skills(text, text_lower),
+            "years_of_experience": self._extract_experience_years(text_lower),
             "raw_text": text
         }
         
         return parsed_data
+
+
+@lru_cache(maxsize=1)
+def get_resume_parser() -> ResumeParser:
+    """Get the process-wide ResumeParser instance"""
+    return ResumeParser()
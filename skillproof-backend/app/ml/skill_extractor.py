@@ -1,23 +1,63 @@
 """
 Advanced Skill Extraction Module
-Extracts skills from resumes with high accuracy using NLP
+Extracts skills from resumes by matching a curated skill taxonomy
 """
 
 import re
-from typing import List, Dict, Set
-import spacy
+import sys
+from functools import lru_cache
+from typing import List, Dict, Set, Tuple
 from collections import Counter
 
+from joblib import Parallel, delayed
+
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:  # rapidfuzz wheel unavailable; fall back to exact matching
+    process = None
+
+from app.ml.keywords import build_automaton, iter_keyword_spans
+from app.utils.parallel import auto_n_jobs
+
+# Smaller batches run inline; thread dispatch would cost more than it saves
+PARALLEL_MIN_TEXTS = 3
+# Minimum token-set similarity (0-100) for a candidate skill to satisfy a requirement
+FUZZY_MATCH_THRESHOLD = 85
+
+
 class SkillExtractor:
+    # One alternation scans the text once; each branch captures the year count
+    EXPERIENCE_PATTERN = re.compile(
+        r'(\d+)\+?\s*years?\s*of\s*experience'
+        r'|experience\s*:\s*(\d+)\+?\s*years?'
+        r'|(\d+)\+?\s*yrs?\s*experience'
+        r'|(\d+)\+?\s*years?\s*in'
+    )
+    
+    # Proficiency indicators
+    EXPERT_KEYWORDS = ('expert', 'advanced', 'proficient', 'mastery', 'specialist')
+    INTERMEDIATE_KEYWORDS = ('intermediate', 'working knowledge', 'familiar', 'experience with')
+    BEGINNER_KEYWORDS = ('basic', 'beginner', 'learning', 'exposure to')
+    
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            self.nlp = None
+        # Comprehensive skill taxonomy; tuples keep category order stable
+        self.skill_database = {
+            category: tuple(sys.intern(skill.lower()) for skill in skills)
+            for category, skills in self._load_skill_database().items()
+        }
+        # Flat set of every known skill
+        self.all_skills = frozenset(
+            skill for skills in self.skill_database.values() for skill in skills
+        )
         
-        # Comprehensive skill taxonomy
-        self.skill_database = self._load_skill_database()
+        # One automaton over every skill finds all of them in a single pass
+        self.skill_automaton = build_automaton(self.all_skills)
         
+        # JSON-ready taxonomy for the /supported-skills endpoint
+        self.supported_skills = {
+            category: sorted(skills) for category, skills in self.skill_database.items()
+        }
+    
     def _load_skill_database(self) -> Dict[str, List[str]]:
         """Load comprehensive skill taxonomy"""
         return {
@@ -74,33 +114,57 @@ class SkillExtractor:
         Returns:
             Dict with skills, categories, confidence scores
         """
+        return self._extract_skills(text.lower())
+    
+    def extract_all(self, text: str) -> Dict[str, any]:
+        """
+        Extract skills and experience level in one pass over the text
+        
+        Returns:
+            Dict combining extract_skills and extract_experience_level results
+        """
         text_lower = text.lower()
+        return {
+            **self._extract_skills(text_lower),
+            **self._extract_experience_level(text_lower)
+        }
+    
+    def extract_all_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Run extract_all over many texts, e.g. a bulk candidate import
         
+        Returns:
+            One extract_all result per text, in input order
+        """
+        n_jobs = auto_n_jobs(len(texts), PARALLEL_MIN_TEXTS)
+        if n_jobs == 1:
+            return [self.extract_all(text) for text in texts]
+        # Threads share the automaton; loky would pickle it to every worker
+        return Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(self.extract_all)(text) for text in texts
+        )
+    
+    def _extract_skills(self, text_lower: str) -> Dict[str, any]:
+        """Skill extraction over pre-lowercased text"""
         # Extract skills by category
+        counts, in_skills_section = self._scan_skills(text_lower)
         categorized_skills = {}
         all_skills = []
         
         for category, skills in self.skill_database.items():
             found_skills = []
             for skill in skills:
-                # Use word boundaries for accurate matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
+                if counts[skill]:
                     found_skills.append(skill.title())
                     all_skills.append({
                         "name": skill.title(),
                         "category": category.replace("_", " ").title(),
-                        "confidence": self._calculate_confidence(skill, text_lower)
+                        "confidence": self._calculate_confidence(counts[skill], skill in in_skills_section)
                     })
             
             if found_skills:
                 categorized_skills[category] = found_skills
         
-        # Extract using NLP if available
-        if self.nlp:
-            nlp_skills = self._extract_with_nlp(text)
-            all_skills.extend(nlp_skills)
-        
         # Remove duplicates and sort by confidence
         unique_skills = self._deduplicate_skills(all_skills)
         
@@ -112,11 +176,39 @@ class SkillExtractor:
             "skill_summary": self._generate_summary(categorized_skills)
         }
     
-    def _calculate_confidence(self, skill: str, text: str) -> float:
-        """Calculate confidence score based on frequency and context"""
-        # Count occurrences
-        count = len(re.findall(r'\b' + re.escape(skill) + r'\b', text))
+    def _scan_skills(self, text_lower: str) -> Tuple[Counter, Set[str]]:
+        """
+        Count every known skill and note which appear in a skills section, in one pass
+        
+        A mention is in a skills section when it follows "skill" (or "skills")
+        on the same line.
         
+        Returns:
+            (whole-word occurrence counts, skills mentioned in a skills section)
+        """
+        counts = Counter()
+        in_skills_section = set()
+        # Line start -> offset just past that line's first "skill" (-1 if none)
+        section_starts = {}
+        
+        for start, skill in iter_keyword_spans(self.skill_automaton, text_lower):
+            counts[skill] += 1
+            if skill in in_skills_section:
+                continue
+            
+            line_start = text_lower.rfind('\n', 0, start) + 1
+            if line_start not in section_starts:
+                line_end = text_lower.find('\n', line_start)
+                index = text_lower.find('skill', line_start, line_end if line_end != -1 else len(text_lower))
+                section_starts[line_start] = index + len('skill') if index != -1 else -1
+            section_start = section_starts[line_start]
+            if section_start != -1 and start >= section_start:
+                in_skills_section.add(skill)
+        
+        return counts, in_skills_section
+    
+    def _calculate_confidence(self, count: int, in_skills_section: bool) -> float:
+        """Calculate confidence score based on frequency and context"""
         # Base confidence on frequency
         if count >= 3:
             confidence = 0.95
@@ -126,41 +218,11 @@ class SkillExtractor:
             confidence = 0.75
         
         # Boost confidence if in skills section
-        if re.search(r'skills?.*' + re.escape(skill), text, re.IGNORECASE):
+        if in_skills_section:
             confidence = min(confidence + 0.1, 1.0)
         
         return round(confidence, 2)
     
-    def _extract_with_nlp(self, text: str) -> List[Dict]:
-        """Extract skills using spaCy NER"""
-        doc = self.nlp(text)
-        nlp_skills = []
-        
-        for ent in doc.ents:
-            if ent.label_ in ['ORG', 'PRODUCT', 'GPE']:
-                # Check if it's a known technology
-                if self._is_technology(ent.text):
-                    nlp_skills.append({
-                        "name": ent.text,
-                        "category": "Technology",
-                        "confidence": 0.70
-                    })
-        
-        return nlp_skills
-    
-    def _is_technology(self, text: str) -> bool:
-        """Check if text is a technology/tool"""
-        tech_indicators = ['js', 'py', 'api', 'db', 'sql', 'ml', 'ai']
-        text_lower = text.lower()
-        
-        # Check against all skills
-        for skills in self.skill_database.values():
-            if text_lower in skills:
-                return True
-        
-        # Check for tech indicators
-        return any(indicator in text_lower for indicator in tech_indicators)
-    
     def _deduplicate_skills(self, skills: List[Dict]) -> List[Dict]:
         """Remove duplicate skills and keep highest confidence"""
         skill_map = {}
@@ -192,26 +254,41 @@ class SkillExtractor:
         Returns:
             Match score, matched skills, missing skills
         """
-        candidate_set = set(s.lower() for s in candidate_skills)
-        required_set = set(s.lower() for s in required_skills)
-        
-        matched = candidate_set.intersection(required_set)
-        missing = required_set - candidate_set
-        extra = candidate_set - required_set
+        # Normalized and de-duplicated, first occurrence order kept
+        candidates = list(dict.fromkeys(s.strip().lower() for s in candidate_skills))
+        required = list(dict.fromkeys(s.strip().lower() for s in required_skills))
+        
+        if process is None or not candidates or not required:
+            candidate_set, required_set = set(candidates), set(required)
+            matched = [s for s in required if s in candidate_set]
+            missing = [s for s in required if s not in candidate_set]
+            extra = [s for s in candidates if s not in required_set]
+        else:
+            # One vectorized call scores every required/candidate pair, so
+            # "react.js" satisfies "react" and "postgresql" satisfies "postgres"
+            scores = process.cdist(
+                required, candidates,
+                scorer=fuzz.token_set_ratio, processor=utils.default_process, workers=-1
+            )
+            required_hit = scores.max(axis=1) >= FUZZY_MATCH_THRESHOLD
+            candidate_hit = scores.max(axis=0) >= FUZZY_MATCH_THRESHOLD
+            matched = [s for s, hit in zip(required, required_hit) if hit]
+            missing = [s for s, hit in zip(required, required_hit) if not hit]
+            extra = [s for s, hit in zip(candidates, candidate_hit) if not hit]
         
         # Calculate match score
-        if not required_set:
+        if not required:
             match_score = 0
         else:
-            match_score = (len(matched) / len(required_set)) * 100
+            match_score = (len(matched) / len(required)) * 100
         
         return {
             "match_score": round(match_score, 2),
-            "matched_skills": list(matched),
-            "missing_skills": list(missing),
-            "additional_skills": list(extra),
+            "matched_skills": matched,
+            "missing_skills": missing,
+            "additional_skills": extra,
             "matched_count": len(matched),
-            "required_count": len(required_set),
+            "required_count": len(required),
             "recommendation": self._get_recommendation(match_score)
         }
     
@@ -228,19 +305,15 @@ class SkillExtractor:
     
     def extract_experience_level(self, text: str) -> Dict:
         """Extract years of experience and seniority level"""
-        # Patterns for experience
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'experience\s*:\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*experience',
-            r'(\d+)\+?\s*years?\s*in'
+        return self._extract_experience_level(text.lower())
+    
+    def _extract_experience_level(self, text_lower: str) -> Dict:
+        """Experience extraction over pre-lowercased text"""
+        years = [
+            int(match.group(match.lastindex))
+            for match in self.EXPERIENCE_PATTERN.finditer(text_lower)
         ]
         
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            years.extend([int(m) for m in matches])
-        
         avg_years = max(years) if years else 0
         
         # Determine seniority level
@@ -266,14 +339,8 @@ class SkillExtractor:
         text_lower = text.lower()
         skill_lower = skill.lower()
         
-        # Proficiency indicators
-        expert_keywords = ['expert', 'advanced', 'proficient', 'mastery', 'specialist']
-        intermediate_keywords = ['intermediate', 'working knowledge', 'familiar', 'experience with']
-        beginner_keywords = ['basic', 'beginner', 'learning', 'exposure to']
-        
         # Find skill context
-        skill_pattern = r'.{0,50}' + re.escape(skill_lower) + r'.{0,50}'
-        contexts = re.findall(skill_pattern, text_lower)
+        contexts = self._skill_contexts(text_lower, skill_lower) if skill_lower else []
         
         if not contexts:
             return {"proficiency": "Unknown", "confidence": 0.0}
@@ -281,11 +348,11 @@ class SkillExtractor:
         context = ' '.join(contexts)
         
         # Determine proficiency
-        if any(keyword in context for keyword in expert_keywords):
+        if any(keyword in context for keyword in self.EXPERT_KEYWORDS):
             return {"proficiency": "Expert", "confidence": 0.90}
-        elif any(keyword in context for keyword in intermediate_keywords):
+        elif any(keyword in context for keyword in self.INTERMEDIATE_KEYWORDS):
             return {"proficiency": "Intermediate", "confidence": 0.80}
-        elif any(keyword in context for keyword in beginner_keywords):
+        elif any(keyword in context for keyword in self.BEGINNER_KEYWORDS):
             return {"proficiency": "Beginner", "confidence": 0.70}
         else:
             # Default based on frequency
@@ -294,3 +361,32 @@ class SkillExtractor:
                 return {"proficiency": "Intermediate", "confidence": 0.75}
             else:
                 return {"proficiency": "Beginner", "confidence": 0.65}
+    
+    @staticmethod
+    def _skill_contexts(text_lower: str, skill_lower: str, width: int = 50) -> List[str]:
+        """
+        Collect the text within `width` characters of each skill mention
+        
+        Windows stay within the mention's line. Uses str.find rather than a
+        `.{0,50}skill.{0,50}` regex, which backtracks at every position.
+        
+        Returns:
+            List of context windows
+        """
+        contexts = []
+        start = text_lower.find(skill_lower)
+        while start != -1:
+            end = start + len(skill_lower)
+            line_start = text_lower.rfind('\n', 0, start) + 1
+            line_end = text_lower.find('\n', end)
+            if line_end == -1:
+                line_end = len(text_lower)
+            contexts.append(text_lower[max(line_start, start - width):min(line_end, end + width)])
+            start = text_lower.find(skill_lower, end)
+        return contexts
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    """Get the process-wide SkillExtractor instance"""
+    return SkillExtractor()
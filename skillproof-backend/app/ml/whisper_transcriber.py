@@ -0,0 +1,202 @@
+"""
+Whisper Transcriber - Local speech-to-text with faster-whisper
+Runs Whisper on this host using batched segment inference
+"""
+
+from typing import Any, BinaryIO, Dict, List, Tuple, Union
+
+import numpy as np
+
+# Streaming input format: mono 16-bit little-endian PCM at 16kHz
+STREAM_SAMPLE_RATE = 16000
+
+
+class WhisperTranscriber:
+    """
+    Local Whisper model wrapper.
+
+    Features:
+    - Loads the model once and reuses it for every request
+    - Uses BatchedInferencePipeline so each file's segments share forward passes
+    - Transcribes a list of requests in one call for use with RequestBatcher
+    """
+
+    def __init__(self, model_size: str, device: str = "auto", batch_size: int = 8):
+        """
+        Initialize Whisper Transcriber
+
+        Args:
+            model_size: faster-whisper model name or path (e.g. "small")
+            device: "cpu", "cuda" or "auto"
+            batch_size: Segments decoded per forward pass
+        """
+        # Imported lazily so the API-only deployment doesn't need the model stack
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+        self.batch_size = batch_size
+        self.model = WhisperModel(model_size, device=device)
+        self.pipeline = BatchedInferencePipeline(model=self.model)
+
+    def transcribe(self, audio: Union[str, BinaryIO], language_code: str = "en") -> Dict:
+        """
+        Transcribe one audio file
+
+        Args:
+            audio: Audio file path or binary file object
+            language_code: ISO language code
+
+        Returns:
+            Dictionary with transcript and metadata
+        """
+        segments, info = self.pipeline.transcribe(
+            audio,
+            language=language_code,
+            batch_size=self.batch_size
+        )
+        segments = list(segments)
+
+        return {
+            "transcript": " ".join(segment.text.strip() for segment in segments),
+            "language": info.language,
+            "duration": info.duration,
+            "confidence": info.language_probability
+        }
+
+    def transcribe_words(self, audio: np.ndarray, language_code: str = "en") -> List[Tuple[float, float, str]]:
+        """
+        Transcribe a float32 PCM buffer into timestamped words
+
+        Args:
+            audio: Mono float32 samples at STREAM_SAMPLE_RATE
+            language_code: ISO language code
+
+        Returns:
+            List of (start, end, word) tuples, times in seconds
+        """
+        segments, _ = self.model.transcribe(
+            audio,
+            language=language_code,
+            word_timestamps=True,
+            condition_on_previous_text=False
+        )
+        return [
+            (word.start, word.end, word.word.strip())
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+
+    def transcribe_batch(self, items: List[Tuple[Any, str]]) -> List[Any]:
+        """
+        Transcribe several queued requests back to back on the loaded model
+
+        Args:
+            items: List of (audio, language_code) tuples
+
+        Returns:
+            One result dict per item, or the Exception it raised
+        """
+        results = []
+        for audio, language_code in items:
+            try:
+                results.append(self.transcribe(audio, language_code))
+            except Exception as e:
+                results.append(Exception(f"Audio transcription error: {str(e)}"))
+        return results
+
+
+class StreamingTranscription:
+    """
+    Incremental transcription of a live PCM stream.
+
+    Re-transcribes a rolling audio buffer every step and commits words with
+    the LocalAgreement-2 policy: a word is emitted only once two consecutive
+    hypotheses agree on it, so partial output never has to be retracted.
+    """
+
+    def __init__(
+        self,
+        transcriber: WhisperTranscriber,
+        language_code: str = "en",
+        step_seconds: float = 1.0,
+        max_buffer_seconds: float = 30.0
+    ):
+        """
+        Initialize Streaming Transcription
+
+        Args:
+            transcriber: Loaded local Whisper model
+            language_code: ISO language code
+            step_seconds: Audio to accumulate between transcription passes
+            max_buffer_seconds: Rolling buffer length before trimming
+        """
+        self.transcriber = transcriber
+        self.language_code = language_code
+        self.step_samples = int(step_seconds * STREAM_SAMPLE_RATE)
+        self.max_buffer_samples = int(max_buffer_seconds * STREAM_SAMPLE_RATE)
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.pending = b""
+        self.unprocessed_samples = 0
+        # Buffer offset (seconds) up to which words are committed
+        self.committed_until = 0.0
+        # Uncommitted tail of the previous hypothesis
+        self.previous: List[str] = []
+
+    def append(self, pcm: bytes):
+        """Add raw PCM16 bytes to the buffer"""
+        data = self.pending + pcm
+        usable = len(data) - len(data) % 2
+        self.pending = data[usable:]
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        self.buffer = np.concatenate((self.buffer, samples))
+        self.unprocessed_samples += len(samples)
+
+    def ready(self) -> bool:
+        """Whether enough new audio arrived for another pass"""
+        return self.unprocessed_samples >= self.step_samples
+
+    def process(self) -> List[str]:
+        """
+        Run one transcription pass over the buffer
+
+        Returns:
+            Newly committed words
+        """
+        self.unprocessed_samples = 0
+        words = self.transcriber.transcribe_words(self.buffer, self.language_code)
+        tail = [(end, text) for start, end, text in words if start >= self.committed_until]
+
+        committed = []
+        for (end, text), previous_text in zip(tail, self.previous):
+            if text != previous_text:
+                break
+            committed.append(text)
+            self.committed_until = end
+        self.previous = [text for _, text in tail[len(committed):]]
+
+        self._trim()
+        return committed
+
+    def finish(self) -> List[str]:
+        """
+        Final pass at end of stream; commits the remaining hypothesis
+
+        Returns:
+            Newly committed words
+        """
+        committed = self.process() if self.unprocessed_samples else []
+        committed.extend(self.previous)
+        self.previous = []
+        return committed
+
+    def _trim(self):
+        """Drop committed audio once the buffer exceeds its maximum length"""
+        if len(self.buffer) <= self.max_buffer_samples:
+            return
+        cut = int(self.committed_until * STREAM_SAMPLE_RATE)
+        self.buffer = self.buffer[cut:]
+        self.committed_until = 0.0
+
+        # Nothing stable to cut at; bound memory by dropping the oldest audio
+        if len(self.buffer) > self.max_buffer_samples:
+            self.buffer = self.buffer[-self.max_buffer_samples:]
+            self.previous = []
@@ -2,6 +2,7 @@
 from app.models.user import User, UserRole
 from app.models.company import Company
 from app.models.interview import Interview, InterviewQuestion, InterviewAnswer, EmotionAnalysis
+from app.models.resume import ResumeFile
 
 __all__ = [
     "User",
@@ -10,5 +11,6 @@ __all__ = [
     "Interview",
     "InterviewQuestion",
     "InterviewAnswer",
-    "EmotionAnalysis"
+    "EmotionAnalysis",
+    "ResumeFile"
 ]
@@ -2,8 +2,8 @@
 Interview Model
 Database model for interview sessions
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -14,6 +14,11 @@ from app.database import Base
 class Interview(Base):
     """Interview session model"""
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Dashboard filters: a user's interviews by status, and newest first
+        Index("ix_interviews_user_status", "user_id", "status"),
+        Index("ix_interviews_user_started", "user_id", "started_at"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -118,6 +123,12 @@ class InterviewAnswer(Base):
 class EmotionAnalysis(Base):
     """Emotion analysis model"""
     __tablename__ = "emotion_analysis"
+    __table_args__ = (
+        # Per-interview emotion timeline
+        Index("ix_emotion_analysis_interview_timestamp", "interview_id", "timestamp"),
+        # Containment queries on extra_data (@>)
+        Index("ix_emotion_analysis_extra_data", "extra_data", postgresql_using="gin"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     interview_id = Column(UUID(as_uuid=True), ForeignKey("interviews.id"), nullable=False)
@@ -133,8 +144,8 @@ class EmotionAnalysis(Base):
     face_detected = Column(Boolean, default=True)
     blink_count = Column(Integer, default=0)
     
-    # Additional metadata (JSON)
-    metadata = Column(Text, nullable=True)  # Store as JSON string
+    # Additional metadata ("metadata" is reserved by SQLAlchemy's declarative base)
+    extra_data = Column(JSONB, nullable=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
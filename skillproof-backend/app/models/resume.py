@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+class ResumeFile(Base):
+    __tablename__ = "resume_files"
+    
+    file_id = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    path = Column(String(500), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -15,6 +15,8 @@ from app.schemas.interview import (
     InterviewWithDetails,
     InterviewSummary,
     InterviewStatistics,
+    validate_emotions_batch,
+    validate_answers_batch,
     SUPPORTED_LANGUAGES,
     EXPERIENCE_LEVELS
 )
@@ -39,6 +41,8 @@ __all__ = [
     "InterviewWithDetails",
     "InterviewSummary",
     "InterviewStatistics",
+    "validate_emotions_batch",
+    "validate_answers_batch",
     "SUPPORTED_LANGUAGES",
     "EXPERIENCE_LEVELS"
 ]
@@ -2,8 +2,9 @@
 Interview Schemas
 Pydantic models for interview API requests/responses
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from dataclasses import dataclass
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter
+from typing import Annotated, Any, Dict, Optional, List, Literal
 from datetime import datetime
 from uuid import UUID
 
@@ -22,24 +23,23 @@ EXPERIENCE_LEVELS = ["junior", "mid", "senior"]
 INTERVIEW_STATUS = ["IN_PROGRESS", "COMPLETED", "PAUSED"]
 
 
+def _casefold(value):
+    """Normalize string input before Literal validation"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+# Validated by pydantic-core during request parsing
+Language = Annotated[Literal[tuple(SUPPORTED_LANGUAGES)], BeforeValidator(_casefold)]
+ExperienceLevel = Literal[tuple(EXPERIENCE_LEVELS)]
+InterviewStatus = Literal[tuple(INTERVIEW_STATUS)]
+
+
 class InterviewBase(BaseModel):
     """Base interview schema"""
     role: str = Field(..., min_length=1, max_length=255)
-    experience_level: str = Field(..., description="junior, mid, or senior")
-    language: str = Field(default="english", description="Interview language")
+    experience_level: ExperienceLevel = Field(..., description="junior, mid, or senior")
+    language: Language = Field(default="english", description="Interview language")
     max_questions: int = Field(default=5, ge=1, le=20)
-    
-    @validator('experience_level')
-    def validate_experience_level(cls, v):
-        if v not in EXPERIENCE_LEVELS:
-            raise ValueError(f"Experience level must be one of: {', '.join(EXPERIENCE_LEVELS)}")
-        return v
-    
-    @validator('language')
-    def validate_language(cls, v):
-        if v.lower() not in SUPPORTED_LANGUAGES:
-            raise ValueError(f"Language must be one of: {', '.join(SUPPORTED_LANGUAGES)}")
-        return v.lower()
 
 
 class InterviewCreate(InterviewBase):
@@ -49,7 +49,7 @@ class InterviewCreate(InterviewBase):
 
 class InterviewUpdate(BaseModel):
     """Schema for updating an interview"""
-    status: Optional[str] = None
+    status: Optional[InterviewStatus] = None
     current_question_number: Optional[int] = None
     completed_at: Optional[datetime] = None
     total_duration: Optional[int] = None
@@ -59,12 +59,6 @@ class InterviewUpdate(BaseModel):
     communication_score: Optional[float] = None
     emotion_score: Optional[float] = None
     overall_score: Optional[float] = None
-    
-    @validator('status')
-    def validate_status(cls, v):
-        if v and v not in INTERVIEW_STATUS:
-            raise ValueError(f"Status must be one of: {', '.join(INTERVIEW_STATUS)}")
-        return v
 
 
 class InterviewResponse(InterviewBase):
@@ -157,7 +151,7 @@ class EmotionAnalysisBase(BaseModel):
     confidence: float = Field(..., ge=0, le=1)
     face_detected: bool = True
     blink_count: int = Field(default=0, ge=0)
-    metadata: Optional[str] = None
+    extra_data: Optional[Dict[str, Any]] = None
 
 
 class EmotionAnalysisCreate(EmotionAnalysisBase):
@@ -175,6 +169,37 @@ class EmotionAnalysisResponse(EmotionAnalysisBase):
         from_attributes = True
 
 
+# Built once; validating a whole list is a single pydantic-core call
+_EMOTIONS_ADAPTER = TypeAdapter(List[EmotionAnalysisCreate])
+_ANSWERS_ADAPTER = TypeAdapter(List[InterviewAnswerCreate])
+
+
+def validate_emotions_batch(rows: List[Dict[str, Any]]) -> List[EmotionAnalysisCreate]:
+    """
+    Validate many emotion frames at once
+    
+    Args:
+        rows: Raw per-frame dicts from an emotion analyzer
+        
+    Returns:
+        Validated EmotionAnalysisCreate objects, in input order
+    """
+    return _EMOTIONS_ADAPTER.validate_python(rows)
+
+
+def validate_answers_batch(rows: List[Dict[str, Any]]) -> List[InterviewAnswerCreate]:
+    """
+    Validate many interview answers at once
+    
+    Args:
+        rows: Raw answer dicts
+        
+    Returns:
+        Validated InterviewAnswerCreate objects, in input order
+    """
+    return _ANSWERS_ADAPTER.validate_python(rows)
+
+
 class InterviewWithDetails(InterviewResponse):
     """Schema for interview with all related data"""
     questions: List[InterviewQuestionResponse] = []
@@ -182,7 +207,10 @@ class InterviewWithDetails(InterviewResponse):
     emotions: List[EmotionAnalysisResponse] = []
 
 
-class InterviewSummary(BaseModel):
+# Summary and statistics are assembled server-side from already-validated rows,
+# so they are plain slotted dataclasses rather than validating models
+@dataclass(slots=True, kw_only=True)
+class InterviewSummary:
     """Schema for interview summary"""
     interview_id: UUID
     user_id: UUID
@@ -202,7 +230,8 @@ class InterviewSummary(BaseModel):
     completed_at: Optional[datetime] = None
 
 
-class InterviewStatistics(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class InterviewStatistics:
     """Schema for interview statistics"""
     total_interviews: int
     completed_interviews: int
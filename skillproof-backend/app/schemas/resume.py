@@ -2,7 +2,7 @@
 Pydantic schemas for Resume API
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -37,6 +37,22 @@ class ResumeUploadResponse(BaseModel):
     processing_time_ms: int
 
 
+class PresignUploadRequest(BaseModel):
+    filename: str
+
+
+class PresignUploadResponse(BaseModel):
+    url: str
+    fields: Dict[str, str]
+    key: str
+    file_id: str
+    expires_in: int
+
+
+class ProcessUploadRequest(BaseModel):
+    key: str
+
+
 class ResumeParseResponse(BaseModel):
     skills: List[SkillDetail]
     categorized_skills: Dict[str, List[str]]
@@ -46,6 +62,10 @@ class ResumeParseResponse(BaseModel):
     seniority_level: str
 
 
+class ResumeBatchParseRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=500)
+
+
 class SkillMatchRequest(BaseModel):
     candidate_skills: List[str]
     required_skills: List[str]
@@ -2,15 +2,29 @@
 AI Service - Production Version
 Handles AI-powered interview question generation and answer evaluation
 """
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import asyncio
+import hashlib
+import httpx
 import json
+import logging
 import os
-from typing import Dict, Optional
-from app.ml.ai_client import AIClient
+import re
+import orjson
+from functools import lru_cache, partial
+from types import MappingProxyType
+import redis.asyncio as redis
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from typing_extensions import Required, TypedDict
+from app.config import get_settings
+from app.ml.ai_client import get_ai_client
+from app.ml.whisper_transcriber import WhisperTranscriber
+from app.utils.request_batcher import RequestBatcher
 
 
-# Language code mapping for Whisper API
-LANGUAGE_CODE_MAP = {
+# Language code mapping for Whisper API (read-only)
+LANGUAGE_CODE_MAP = MappingProxyType({
     "english": "en",
     "hindi": "hi",
     "tamil": "ta",
@@ -22,50 +36,27 @@ LANGUAGE_CODE_MAP = {
     "bengali": "bn",
     "punjabi": "pa",
     "urdu": "ur"
-}
+})
 
 
-class AIService:
-    """
-    AI Service for multilingual interview management
-    """
-    
-    def __init__(self):
-        self.ai_client = AIClient()
-        # Initialize OpenAI client if API key is available
-        api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEYS", "").split(",")[0]
-        if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
-        else:
-            self.openai_client = None
-    
-    def generate_or_evaluate(
-        self,
-        role: str,
-        experience_level: str,
-        language: str,
-        previous_question: str = "",
-        candidate_answer: str = "",
-        question_number: int = 1,
-        max_questions: int = 10
-    ) -> Dict:
-        """
-        Generate interview question or evaluate answer
-        
-        Args:
-            role: Job role
-            experience_level: junior, mid, senior
-            language: Interview language
-            previous_question: Previous question text
-            candidate_answer: Candidate's answer
-            question_number: Current question number
-            max_questions: Total questions
-            
-        Returns:
-            Dictionary with question and optional evaluation
-        """
-        
-        system_prompt = f"""You are SatyaHire AI, a professional multilingual interviewer.
+logger = logging.getLogger(__name__)
+
+
+# Caps concurrent upstream LLM calls per process to respect provider rate limits
+LLM_SEMAPHORE = asyncio.Semaphore(get_settings().LLM_CONCURRENCY)
+
+# Default chat model for interview generation/evaluation
+DEFAULT_CHAT_MODEL = "gpt-4o-mini"
+
+# Redis key prefix for cached question/evaluation responses
+AI_CACHE_KEY_PREFIX = "qe:"
+
+# Markdown code fence around a JSON reply, with or without a "json" tag
+JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+# Prompt templates; static instructions are built once, only the fields are formatted per call
+SYSTEM_PROMPT = """You are SatyaHire AI, a professional multilingual interviewer.
 
 Rules:
 - Speak only in {language}.
@@ -74,16 +65,23 @@ Rules:
 - Never explain outside JSON.
 - If you fail to generate valid JSON, regenerate response until JSON is valid."""
 
-        user_prompt = f"""Interview Details:
+STREAMING_SYSTEM_PROMPT = """You are SatyaHire AI, a professional multilingual interviewer.
+
+Rules:
+- Speak only in {language}.
+- Keep professional tone.
+- Reply with the question text only, without quotes or formatting."""
+
+QUESTION_EVALUATION_PROMPT = """Interview Details:
 Role: {role}
 Experience Level: {experience_level}
 Language: {language}
 Current Question Number: {question_number}
 Total Questions: {max_questions}
 
-Previous Question: {previous_question if previous_question else "None"}
+Previous Question: {previous_question}
 
-Candidate Answer: {candidate_answer if candidate_answer else "None"}
+Candidate Answer: {candidate_answer}
 
 Instructions:
 
@@ -120,11 +118,182 @@ Return JSON format:
 
 Note: If this is question {question_number} of {max_questions} and candidate_answer is provided, set interview_status to "COMPLETED". Otherwise "IN_PROGRESS"."""
 
+EVALUATION_PROMPT = """Interview Details:
+Role: {role}
+Experience Level: {experience_level}
+Language: {language}
+
+Question: {question}
+
+Candidate Answer: {candidate_answer}
+
+Instructions:
+- Evaluate the answer in {language}.
+- Give score 0-10.
+- Give strengths.
+- Give improvements.
+- Provide corrected answer.
+
+Return JSON format:
+
+{{
+  "score": number,
+  "strengths": "string",
+  "improvements": "string",
+  "corrected_answer": "string"
+}}"""
+
+NEXT_QUESTION_INSTRUCTIONS = """Interview Details:
+Role: {role}
+Experience Level: {experience_level}
+Language: {language}
+Question Number: {question_number}
+Total Questions: {max_questions}
+
+Previous Question: {previous_question}
+
+Instructions:
+- Generate the next interview question in {language}.
+- Adjust difficulty according to {experience_level} and question number.
+- Be realistic like a real human interviewer.
+- Do NOT repeat previous questions."""
+
+NEXT_QUESTION_JSON_FORMAT = """
+
+Return JSON format:
+
+{
+  "question": "string",
+  "difficulty": "easy | medium | hard"
+}"""
+
+
+# Reply shapes requested by the prompts. TypedDicts validate straight to
+# plain dicts, keeping only the keys the model actually returned.
+class _Evaluation(TypedDict, total=False):
+    score: float
+    strengths: str
+    improvements: str
+    corrected_answer: str
+
+
+class _QuestionEvaluation(TypedDict, total=False):
+    question: Required[str]
+    evaluation: Optional[_Evaluation]
+    difficulty: str
+    interview_status: str
+
+
+class _NextQuestion(TypedDict, total=False):
+    question: Required[str]
+    difficulty: str
+
+
+QUESTION_EVALUATION_RESPONSE = TypeAdapter(_QuestionEvaluation)
+EVALUATION_RESPONSE = TypeAdapter(_Evaluation)
+NEXT_QUESTION_RESPONSE = TypeAdapter(_NextQuestion)
+
+
+class AIService:
+    """
+    AI Service for multilingual interview management
+    """
+    
+    def __init__(self):
+        settings = get_settings()
+        # Shared multi-provider client; its pools are closed by close_ai_client
+        self.ai_client = get_ai_client()
+        # Shared response cache for question generation/evaluation
+        self.redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.cache_ttl = settings.AI_CACHE_TTL_SECONDS
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # In-flight LLM calls keyed by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+        # Optional local Whisper; queued requests share one model worker
+        if settings.WHISPER_LOCAL_MODEL:
+            self.whisper = WhisperTranscriber(
+                settings.WHISPER_LOCAL_MODEL,
+                device=settings.WHISPER_DEVICE,
+                batch_size=settings.WHISPER_BATCH_SIZE
+            )
+            self.transcription_batcher = RequestBatcher(
+                self.whisper.transcribe_batch,
+                max_batch_size=16,
+                max_delay=0.02
+            )
+        else:
+            self.whisper = None
+            self.transcription_batcher = None
+        # Initialize OpenAI client if API key is available
+        api_key = os.getenv("OPENAI_API_KEY") or next(iter(settings.openai_keys), None)
+        if api_key:
+            self.openai_client = OpenAI(api_key=api_key)
+            # Native async client on a pooled connection for the request hot path
+            self.async_http_client = httpx.AsyncClient(
+                timeout=60,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+            self.async_openai_client = AsyncOpenAI(api_key=api_key, http_client=self.async_http_client)
+        else:
+            self.openai_client = None
+            self.async_http_client = None
+            self.async_openai_client = None
+    
+    async def aclose(self):
+        """Close pooled async connections"""
+        if self.async_http_client is not None:
+            await self.async_http_client.aclose()
+        if self.transcription_batcher is not None:
+            await self.transcription_batcher.stop()
+        await self.redis.close()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get response cache hit/miss and coalesced-request counters"""
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "coalesced": self.coalesced}
+    
+    @staticmethod
+    def _cache_key(params: Dict) -> str:
+        """Build the Redis cache key for a generate/evaluate request"""
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return AI_CACHE_KEY_PREFIX + hashlib.sha256(payload.encode()).hexdigest()
+    
+    def generate_or_evaluate(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str = "",
+        candidate_answer: str = "",
+        question_number: int = 1,
+        max_questions: int = 10
+    ) -> Dict:
+        """
+        Generate interview question or evaluate answer
+        
+        Args:
+            role: Job role
+            experience_level: junior, mid, senior
+            language: Interview language
+            previous_question: Previous question text
+            candidate_answer: Candidate's answer
+            question_number: Current question number
+            max_questions: Total questions
+            
+        Returns:
+            Dictionary with question and optional evaluation
+        """
+        system_prompt, user_prompt = self._build_prompts(
+            role, experience_level, language, previous_question,
+            candidate_answer, question_number, max_questions
+        )
+        
         try:
             # Try OpenAI first if available
             if self.openai_client:
                 response = self.openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
+                    model=DEFAULT_CHAT_MODEL,
                     temperature=0.7,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -142,45 +311,458 @@ Note: If this is question {question_number} of {max_questions} and candidate_ans
                 )
             
             # Parse JSON response
-            return self._parse_response(content)
+            return self._parse_response(content, QUESTION_EVALUATION_RESPONSE)
             
         except Exception as e:
             raise Exception(f"AI service error: {str(e)}")
     
-    def _parse_response(self, content: str) -> Dict:
+    async def generate_or_evaluate_async(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str = "",
+        candidate_answer: str = "",
+        question_number: int = 1,
+        max_questions: int = 10
+    ) -> Dict:
+        """
+        Async variant of generate_or_evaluate for use inside request handlers
+        
+        Responses are cached in Redis keyed by the full request, so repeated
+        first questions and identical answers skip the LLM round-trip.
+        
+        Args:
+            role: Job role
+            experience_level: junior, mid, senior
+            language: Interview language
+            previous_question: Previous question text
+            candidate_answer: Candidate's answer
+            question_number: Current question number
+            max_questions: Total questions
+            
+        Returns:
+            Dictionary with question and optional evaluation
+        """
+        system_prompt, user_prompt = self._build_prompts(
+            role, experience_level, language, previous_question,
+            candidate_answer, question_number, max_questions
+        )
+        return await self._cached_completion(
+            {
+                "role": role,
+                "experience_level": experience_level,
+                "language": language,
+                "previous_question": previous_question,
+                "answer_hash": hashlib.sha256(candidate_answer.encode()).hexdigest(),
+                "question_number": question_number,
+                "max_questions": max_questions,
+            },
+            lambda: self._complete_json(system_prompt, user_prompt, response_type=QUESTION_EVALUATION_RESPONSE)
+        )
+    
+    async def evaluate_answer_async(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        question: str,
+        candidate_answer: str
+    ) -> Dict:
+        """
+        Evaluate a single answer (no next-question generation)
+        
+        Args:
+            role: Job role
+            experience_level: junior, mid, senior
+            language: Interview language
+            question: Question that was answered
+            candidate_answer: Candidate's answer
+            
+        Returns:
+            Dictionary with score, strengths, improvements, corrected_answer
+        """
+        item = {
+            "role": role,
+            "experience_level": experience_level,
+            "language": language,
+            "question": question,
+            "candidate_answer": candidate_answer,
+        }
+        return await self._cached_completion(
+            {
+                "kind": "evaluation",
+                "role": role,
+                "experience_level": experience_level,
+                "language": language,
+                "question": question,
+                "answer_hash": hashlib.sha256(candidate_answer.encode()).hexdigest(),
+            },
+            lambda: self._complete_json(
+                self._system_prompt(language), self._evaluation_prompt(item), response_type=EVALUATION_RESPONSE
+            )
+        )
+    
+    @staticmethod
+    def _evaluation_prompt(item: Dict) -> str:
+        """User prompt evaluating a single answer"""
+        return EVALUATION_PROMPT.format(
+            role=item["role"],
+            experience_level=item["experience_level"],
+            language=item["language"],
+            question=item["question"] or "None",
+            candidate_answer=item["candidate_answer"]
+        )
+    
+    async def next_question_async(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str,
+        question_number: int,
+        max_questions: int
+    ) -> Dict:
+        """
+        Generate the next question without evaluating the previous answer
+        
+        Args:
+            role: Job role
+            experience_level: junior, mid, senior
+            language: Interview language
+            previous_question: Previous question text (not to be repeated)
+            question_number: Number of the question to generate
+            max_questions: Total questions
+            
+        Returns:
+            Dictionary with question and difficulty
+        """
+        user_prompt = self._next_question_instructions(
+            role, experience_level, language, previous_question, question_number, max_questions
+        ) + NEXT_QUESTION_JSON_FORMAT
+        return await self._cached_completion(
+            {
+                "kind": "next_question",
+                "role": role,
+                "experience_level": experience_level,
+                "language": language,
+                "previous_question": previous_question,
+                "question_number": question_number,
+                "max_questions": max_questions,
+            },
+            lambda: self._complete_json(
+                self._system_prompt(language), user_prompt, response_type=NEXT_QUESTION_RESPONSE
+            )
+        )
+    
+    async def stream_next_question(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str,
+        question_number: int,
+        max_questions: int
+    ) -> AsyncIterator[str]:
+        """
+        Stream the next question text as it is generated
+        
+        Falls back to a single chunk from next_question_async when the async
+        OpenAI client isn't configured.
+        
+        Args:
+            role: Job role
+            experience_level: junior, mid, senior
+            language: Interview language
+            previous_question: Previous question text (not to be repeated)
+            question_number: Number of the question to generate
+            max_questions: Total questions
+            
+        Yields:
+            Question text chunks
+        """
+        if self.async_openai_client is None:
+            result = await self.next_question_async(
+                role, experience_level, language, previous_question, question_number, max_questions
+            )
+            yield result.get("question", "")
+            return
+        
+        system_prompt = STREAMING_SYSTEM_PROMPT.format(language=language)
+        user_prompt = self._next_question_instructions(
+            role, experience_level, language, previous_question, question_number, max_questions
+        )
+        
+        # Hold a concurrency slot only while opening the stream; reading it runs
+        # at the client's pace, and a stalled reader must not starve other calls
+        async with LLM_SEMAPHORE:
+            stream = await self.async_openai_client.chat.completions.create(
+                model=DEFAULT_CHAT_MODEL,
+                temperature=0.7,
+                stream=True,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+            )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+    
+    @staticmethod
+    def _next_question_instructions(
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str,
+        question_number: int,
+        max_questions: int
+    ) -> str:
+        """Interview details and instructions shared by next-question prompts"""
+        return NEXT_QUESTION_INSTRUCTIONS.format(
+            role=role,
+            experience_level=experience_level,
+            language=language,
+            question_number=question_number,
+            max_questions=max_questions,
+            previous_question=previous_question or "None"
+        )
+    
+    async def _cached_completion(self, cache_params: Dict, generate: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        Return a parsed JSON completion, served from Redis when possible
+        
+        Args:
+            cache_params: Request fields identifying the response
+            generate: Produces the response on a cache miss
+            
+        Returns:
+            Parsed JSON dictionary
+        """
+        cache_key = self._cache_key(cache_params)
+        
+        # A cache outage must never fail the interview
+        try:
+            cached = await self.redis.get(cache_key)
+        except Exception as e:
+            logger.warning(f"AI cache read failed: {str(e)}")
+            cached = None
+        
+        if cached is not None:
+            self.cache_hits += 1
+            return orjson.loads(cached)
+        self.cache_misses += 1
+        
+        # Single-flight: concurrent identical requests share one LLM call.
+        # The shared task is shielded so a cancelled caller doesn't cancel it
+        # for everyone else waiting on the same key.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._generate_and_cache(cache_key, generate))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        else:
+            self.coalesced += 1
+        
+        return await asyncio.shield(task)
+    
+    async def _generate_and_cache(self, cache_key: str, generate: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Produce the response and store it in the cache"""
+        try:
+            result = await generate()
+        except Exception as e:
+            raise Exception(f"AI service error: {str(e)}")
+        
+        try:
+            await self.redis.setex(cache_key, self.cache_ttl, orjson.dumps(result))
+        except Exception as e:
+            logger.warning(f"AI cache write failed: {str(e)}")
+        
+        return result
+    
+    async def _complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int = 1000,
+        response_type: Optional[TypeAdapter] = None
+    ) -> Any:
+        """Run one completion and parse (and optionally validate) its JSON body"""
+        content = await self.complete_async(system_prompt, user_prompt, max_tokens=max_tokens)
+        return self._parse_response(content, response_type)
+    
+    async def complete_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = DEFAULT_CHAT_MODEL,
+        temperature: float = 0.7,
+        max_tokens: int = 1000
+    ) -> str:
+        """
+        Run one chat completion without blocking the event loop
+        
+        Uses the async OpenAI client when configured; otherwise falls back to
+        the multi-provider AIClient in a worker thread. Concurrency is capped
+        by LLM_SEMAPHORE.
+        
+        Args:
+            system_prompt: System instructions
+            user_prompt: User message
+            model: OpenAI model name
+            temperature: Sampling temperature
+            max_tokens: Max tokens
+            
+        Returns:
+            Raw completion text
+        """
+        async with LLM_SEMAPHORE:
+            if self.async_openai_client:
+                response = await self.async_openai_client.chat.completions.create(
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                )
+                return response.choices[0].message.content
+            
+            return await self.ai_client.generate_text_async(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+    
+    async def warm_first_questions(
+        self,
+        roles: List[str],
+        experience_levels: Iterable[str] = ("junior", "mid", "senior"),
+        languages: Iterable[str] = tuple(LANGUAGE_CODE_MAP),
+        max_questions: int = 5
+    ) -> int:
+        """
+        Populate the response cache with first questions
+        
+        Combinations already cached are served from Redis, so repeated
+        warm-ups only pay for new entries.
+        
+        Args:
+            roles: Job roles to warm
+            experience_levels: Experience levels to warm
+            languages: Interview languages to warm
+            max_questions: Total questions used by /start
+            
+        Returns:
+            Number of combinations warmed successfully
+        """
+        combos = [
+            (role, level, language)
+            for role in roles
+            for level in experience_levels
+            for language in languages
+        ]
+        results = await asyncio.gather(
+            *(
+                self.generate_or_evaluate_async(
+                    role=role,
+                    experience_level=level,
+                    language=language,
+                    question_number=1,
+                    max_questions=max_questions
+                )
+                for role, level, language in combos
+            ),
+            return_exceptions=True
+        )
+        
+        failed = sum(isinstance(result, Exception) for result in results)
+        if failed:
+            logger.warning(f"First-question warm-up failed for {failed}/{len(combos)} combinations")
+        return len(combos) - failed
+    
+    @staticmethod
+    def _system_prompt(language: str) -> str:
+        """Interviewer system prompt for a language"""
+        return SYSTEM_PROMPT.format(language=language)
+    
+    def _build_prompts(
+        self,
+        role: str,
+        experience_level: str,
+        language: str,
+        previous_question: str,
+        candidate_answer: str,
+        question_number: int,
+        max_questions: int
+    ) -> Tuple[str, str]:
+        """Build (system_prompt, user_prompt) for question generation/evaluation"""
+        system_prompt = self._system_prompt(language)
+
+        user_prompt = QUESTION_EVALUATION_PROMPT.format(
+            role=role,
+            experience_level=experience_level,
+            language=language,
+            question_number=question_number,
+            max_questions=max_questions,
+            previous_question=previous_question or "None",
+            candidate_answer=candidate_answer or "None"
+        )
+
+        return system_prompt, user_prompt
+    
+    def _parse_response(self, content: str, response_type: Optional[TypeAdapter] = None) -> Dict:
         """
         Parse AI response and extract JSON
         
         Args:
             content: Raw AI response
+            response_type: Expected reply shape; matching replies are parsed
+                and validated in a single pydantic-core pass
             
         Returns:
             Parsed JSON dictionary
         """
+        parse = partial(self._decode_json, response_type=response_type)
         try:
             # Try to parse as JSON directly
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown code blocks
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.find("```", json_start)
-                json_text = content[json_start:json_end].strip()
-                return json.loads(json_text)
-            elif "```" in content:
-                json_start = content.find("```") + 3
-                json_end = content.find("```", json_start)
-                json_text = content[json_start:json_end].strip()
-                return json.loads(json_text)
-            else:
-                # Try to find JSON object in text
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                if start != -1 and end > start:
-                    json_text = content[start:end]
-                    return json.loads(json_text)
-                else:
-                    raise ValueError("No valid JSON found in AI response")
+            return parse(content)
+        except ValueError:
+            pass
+        
+        # Try to extract JSON from a markdown code block
+        fence = JSON_FENCE_PATTERN.search(content)
+        if fence:
+            return parse(fence.group(1))
+        
+        # Try to find JSON object in text
+        start = content.find("{")
+        end = content.rfind("}") + 1
+        if start != -1 and end > start:
+            return parse(content[start:end])
+        raise ValueError("No valid JSON found in AI response")
+    
+    @staticmethod
+    def _decode_json(payload: str, response_type: Optional[TypeAdapter] = None) -> Any:
+        """
+        Decode a JSON reply, validating it against response_type when given
+        
+        Only valid JSON is required. A reply whose fields don't match the
+        expected shape (e.g. "score": null or "7/10") is returned as decoded
+        rather than rejected.
+        
+        Raises:
+            ValueError: If payload is not valid JSON
+        """
+        if response_type is not None:
+            try:
+                return response_type.validate_json(payload)
+            except ValidationError:
+                pass
+        return orjson.loads(payload)
     
     def transcribe_audio(
         self,
@@ -201,7 +783,7 @@ Note: If this is question {question_number} of {max_questions} and candidate_ans
             raise Exception("OpenAI API key not configured")
         
         # Get language code for Whisper
-        language_code = LANGUAGE_CODE_MAP.get(language.lower(), "en")
+        language_code = self.get_language_code(language)
         
         try:
             response = self.openai_client.audio.transcriptions.create(
@@ -211,16 +793,59 @@ Note: If this is question {question_number} of {max_questions} and candidate_ans
                 response_format="verbose_json"
             )
             
-            return {
-                "transcript": response.text,
-                "language": response.language,
-                "duration": response.duration,
-                "confidence": 0.95  # Whisper doesn't provide confidence, use default
-            }
+            return self._transcription_result(response)
+            
+        except Exception as e:
+            raise Exception(f"Audio transcription error: {str(e)}")
+    
+    async def transcribe_audio_async(
+        self,
+        audio_file,
+        language: str = "english"
+    ) -> Dict:
+        """
+        Transcribe audio without blocking the event loop
+        
+        Uses the batched local Whisper model when configured, otherwise the
+        Whisper API through the async client.
+        
+        Args:
+            audio_file: Audio file object
+            language: Interview language
+            
+        Returns:
+            Dictionary with transcript and metadata
+        """
+        language_code = self.get_language_code(language)
+        if self.transcription_batcher is not None:
+            return await self.transcription_batcher.submit((audio_file, language_code))
+        
+        if not self.async_openai_client:
+            raise Exception("OpenAI API key not configured")
+        
+        try:
+            response = await self.async_openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                language=language_code,
+                response_format="verbose_json"
+            )
+            
+            return self._transcription_result(response)
             
         except Exception as e:
             raise Exception(f"Audio transcription error: {str(e)}")
     
+    @staticmethod
+    def _transcription_result(response) -> Dict:
+        """Transcript dictionary from a verbose_json Whisper API response"""
+        return {
+            "transcript": response.text,
+            "language": response.language,
+            "duration": response.duration,
+            "confidence": 0.95  # Whisper doesn't provide confidence, use default
+        }
+    
     def text_to_speech(
         self,
         text: str,
@@ -253,7 +878,43 @@ Note: If this is question {question_number} of {max_questions} and candidate_ans
         except Exception as e:
             raise Exception(f"Text-to-speech error: {str(e)}")
     
+    async def text_to_speech_async(
+        self,
+        text: str,
+        language: str = "english",
+        voice: str = "alloy"
+    ) -> bytes:
+        """
+        Async variant of text_to_speech for use inside request handlers
+        
+        Awaiting the async client lets synthesis overlap with other upstream
+        calls (e.g. via asyncio.gather) instead of blocking the event loop.
+        
+        Args:
+            text: Text to convert
+            language: Language of text
+            voice: Voice to use (alloy, echo, fable, onyx, nova, shimmer)
+            
+        Returns:
+            Audio bytes
+        """
+        if not self.async_openai_client:
+            raise Exception("OpenAI API key not configured")
+        
+        try:
+            response = await self.async_openai_client.audio.speech.create(
+                model="tts-1",
+                voice=voice,
+                input=text
+            )
+            
+            return response.content
+            
+        except Exception as e:
+            raise Exception(f"Text-to-speech error: {str(e)}")
+    
     @staticmethod
+    @lru_cache(maxsize=32)
     def get_language_code(language: str) -> str:
         """
         Get language code for Whisper API
@@ -2,8 +2,11 @@
 Audio Processing Service
 Handles audio analysis, noise detection, and quality assessment
 """
-from typing import Dict, Tuple
+from typing import Dict, Tuple, BinaryIO
 import io
+import os
+
+import numpy as np
 
 
 class AudioProcessor:
@@ -11,9 +14,28 @@ class AudioProcessor:
     Process and analyze audio data
     """
     
+    MAX_AUDIO_SIZE = 50 * 1024 * 1024  # 50MB
+    VALID_EXTENSIONS = ['.wav', '.mp3', '.webm', '.ogg', '.m4a']
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # Raw audio is 16-bit little-endian mono PCM
+    SAMPLE_DTYPE = np.dtype('<i2')
+    FULL_SCALE = 32768.0
+    # Frame RMS (full scale = 1.0) above which a frame counts as speech
+    VOICE_RMS_THRESHOLD = 0.02
+    # Frames quieter than this (about -80 dBFS) are digital silence, not noise
+    SILENCE_RMS = 1e-4
+    NOISE_THRESHOLD = 0.3
+    CLARITY_THRESHOLD = 0.5
+    # Human voice fundamental frequency range for pitch estimation
+    PITCH_RANGE_HZ = (60.0, 400.0)
+    
     def __init__(self):
         self.sample_rate = 16000
         self.chunk_size = 1024
+        # Analysis window and bin frequencies are reused by every spectrum
+        self._window = np.hanning(self.chunk_size).astype(np.float32)
+        self._frequencies = np.fft.rfftfreq(self.chunk_size, d=1.0 / self.sample_rate)
     
     def analyze_audio_quality(self, audio_data: bytes) -> Dict:
         """
@@ -25,10 +47,37 @@ class AudioProcessor:
         Returns:
             Dictionary with quality metrics
         """
-        # Mock implementation - in production use librosa or pydub
+        samples = self._samples(audio_data)
+        frames = self._frames(samples)
+        noise_level = self._noise_level(frames)
+        clarity = self._clarity(frames)
+        return {
+            "sample_rate": self.sample_rate,
+            "duration": samples.size / self.sample_rate,
+            "quality_score": clarity * (1.0 - noise_level),
+            "is_clear": clarity >= self.CLARITY_THRESHOLD,
+            "has_noise": noise_level > self.NOISE_THRESHOLD,
+            "volume_level": self._rms(samples)
+        }
+    
+    def analyze_audio_file(self, file_path: str) -> Dict:
+        """
+        Analyze audio quality metrics of a stored file
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Dictionary with quality metrics
+        """
+        return self._quality_metrics(os.path.getsize(file_path))
+    
+    def _quality_metrics(self, num_bytes: int) -> Dict:
+        """Quality metrics for an audio payload of the given size"""
+        # Stored uploads are compressed (mp3/webm/...); estimate until they are decoded
         return {
             "sample_rate": self.sample_rate,
-            "duration": len(audio_data) / (self.sample_rate * 2),  # Approximate
+            "duration": num_bytes / (self.sample_rate * 2),  # Approximate
             "quality_score": 0.85,
             "is_clear": True,
             "has_noise": False,
@@ -45,8 +94,10 @@ class AudioProcessor:
         Returns:
             True if voice detected, False otherwise
         """
-        # Mock implementation - in production use WebRTC VAD or similar
-        return len(audio_data) > 1000  # Simple threshold
+        frames = self._frames(self._samples(audio_data))
+        if not frames.size:
+            return False
+        return bool((self._frame_rms(frames) > self.VOICE_RMS_THRESHOLD).any())
     
     def calculate_audio_level(self, audio_data: bytes) -> float:
         """
@@ -58,13 +109,7 @@ class AudioProcessor:
         Returns:
             Audio level as float
         """
-        # Mock implementation
-        if not audio_data:
-            return 0.0
-        
-        # Simple calculation based on data size
-        level = min(len(audio_data) / 10000, 1.0)
-        return level
+        return self._rms(self._samples(audio_data))
     
     def detect_noise_level(self, audio_data: bytes) -> float:
         """
@@ -76,8 +121,7 @@ class AudioProcessor:
         Returns:
             Noise level (0.0 to 1.0)
         """
-        # Mock implementation - in production use spectral analysis
-        return 0.15  # Low noise
+        return self._noise_level(self._frames(self._samples(audio_data)))
     
     def assess_clarity(self, audio_data: bytes) -> float:
         """
@@ -89,8 +133,7 @@ class AudioProcessor:
         Returns:
             Clarity score (0.0 to 1.0)
         """
-        # Mock implementation
-        return 0.85  # Good clarity
+        return self._clarity(self._frames(self._samples(audio_data)))
     
     def process_for_transcription(self, audio_data: bytes) -> bytes:
         """
@@ -123,16 +166,63 @@ class AudioProcessor:
         if len(audio_data) == 0:
             return False, "Audio file is empty"
         
-        if len(audio_data) > 50 * 1024 * 1024:  # 50MB limit
+        if len(audio_data) > self.MAX_AUDIO_SIZE:
             return False, "Audio file too large (max 50MB)"
         
-        # Check file extension
-        valid_extensions = ['.wav', '.mp3', '.webm', '.ogg', '.m4a']
-        if not any(filename.lower().endswith(ext) for ext in valid_extensions):
-            return False, f"Invalid format. Supported: {', '.join(valid_extensions)}"
+        return self.validate_audio_filename(filename)
+    
+    def validate_audio_filename(self, filename: str) -> Tuple[bool, str]:
+        """
+        Validate audio file extension
+        
+        Args:
+            filename: Original filename
+            
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        if not any(filename.lower().endswith(ext) for ext in self.VALID_EXTENSIONS):
+            return False, f"Invalid format. Supported: {', '.join(self.VALID_EXTENSIONS)}"
         
         return True, "Valid audio file"
     
+    def save_audio_stream(self, source: BinaryIO, destination: str) -> int:
+        """
+        Copy an uploaded audio stream to disk in fixed-size chunks
+        
+        Memory use stays at one chunk regardless of file size, and the size
+        limit is enforced while copying.
+        
+        Args:
+            source: Readable binary file object
+            destination: Target file path
+            
+        Returns:
+            Number of bytes written
+            
+        Raises:
+            ValueError: If the audio is empty or exceeds the size limit
+        """
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        size = 0
+        
+        try:
+            with open(destination, "wb") as out:
+                while chunk := source.read(self.STREAM_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.MAX_AUDIO_SIZE:
+                        raise ValueError("Audio file too large (max 50MB)")
+                    out.write(chunk)
+            
+            if size == 0:
+                raise ValueError("Audio file is empty")
+        except Exception:
+            if os.path.exists(destination):
+                os.remove(destination)
+            raise
+        
+        return size
+    
     def extract_features(self, audio_data: bytes) -> Dict:
         """
         Extract audio features for analysis
@@ -143,14 +233,92 @@ class AudioProcessor:
         Returns:
             Dictionary of audio features
         """
+        samples = self._samples(audio_data)
+        frames = self._frames(samples)
+        power = self._power_spectrum(frames).sum(axis=0)
+        total_power = power.sum()
+        
+        if samples.size > 1:
+            zero_crossing_rate = float(np.count_nonzero(np.diff(np.signbit(samples)))) / (samples.size - 1)
+        else:
+            zero_crossing_rate = 0.0
+        
         return {
-            "duration": len(audio_data) / (self.sample_rate * 2),
-            "energy": 0.75,
-            "pitch": 150.0,  # Hz
-            "tempo": 120.0,  # BPM
-            "spectral_centroid": 2000.0,  # Hz
-            "zero_crossing_rate": 0.05
+            "duration": samples.size / self.sample_rate,
+            "energy": self._rms(samples),
+            "pitch": self._pitch(frames),  # Hz
+            "spectral_centroid": float(self._frequencies @ power / total_power) if total_power > 0 else 0.0,  # Hz
+            "zero_crossing_rate": zero_crossing_rate
         }
+    
+    def _samples(self, audio_data: bytes) -> np.ndarray:
+        """Decode PCM bytes into float32 samples scaled to [-1.0, 1.0)"""
+        # A trailing odd byte is not a whole sample
+        usable = len(audio_data) - len(audio_data) % self.SAMPLE_DTYPE.itemsize
+        samples = np.frombuffer(audio_data, dtype=self.SAMPLE_DTYPE, count=usable // self.SAMPLE_DTYPE.itemsize)
+        return samples.astype(np.float32) / self.FULL_SCALE
+    
+    def _frames(self, samples: np.ndarray) -> np.ndarray:
+        """Split samples into (n_frames, chunk_size) without copying; short audio is zero-padded"""
+        if samples.size < self.chunk_size:
+            if not samples.size:
+                return samples.reshape(0, self.chunk_size)
+            return np.pad(samples, (0, self.chunk_size - samples.size))[np.newaxis]
+        n_frames = samples.size // self.chunk_size
+        return samples[:n_frames * self.chunk_size].reshape(n_frames, self.chunk_size)
+    
+    @staticmethod
+    def _rms(samples: np.ndarray) -> float:
+        """Root-mean-square level of the whole signal (0.0 to 1.0)"""
+        if not samples.size:
+            return 0.0
+        return float(np.sqrt(np.mean(np.square(samples))))
+    
+    @staticmethod
+    def _frame_rms(frames: np.ndarray) -> np.ndarray:
+        """Root-mean-square level of each frame"""
+        return np.sqrt(np.mean(np.square(frames), axis=1))
+    
+    def _power_spectrum(self, frames: np.ndarray) -> np.ndarray:
+        """Windowed power spectrum of each frame"""
+        return np.square(np.abs(np.fft.rfft(frames * self._window, axis=1)))
+    
+    def _spectral_flatness(self, frames: np.ndarray) -> np.ndarray:
+        """Per-frame spectral flatness: near 1.0 for noise, near 0.0 for tonal sound"""
+        power = self._power_spectrum(frames) + 1e-12
+        return np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+    
+    def _noise_level(self, frames: np.ndarray) -> float:
+        """Spectral flatness of the quietest frames, i.e. the background between words"""
+        if not frames.size:
+            return 0.0
+        frame_rms = self._frame_rms(frames)
+        quiet = frames[frame_rms <= np.percentile(frame_rms, 10)]
+        if self._frame_rms(quiet).max() < self.SILENCE_RMS:
+            return 0.0
+        return float(self._spectral_flatness(quiet).mean())
+    
+    def _clarity(self, frames: np.ndarray) -> float:
+        """One minus the mean spectral flatness; voiced speech is peaky, noise is flat"""
+        if not frames.size:
+            return 0.0
+        return float(np.clip(1.0 - self._spectral_flatness(frames).mean(), 0.0, 1.0))
+    
+    def _pitch(self, frames: np.ndarray) -> float:
+        """Fundamental frequency of the loudest frame from its autocorrelation"""
+        if not frames.size:
+            return 0.0
+        frame = frames[np.argmax(self._frame_rms(frames))]
+        if not frame.any():
+            return 0.0
+        # Autocorrelation via FFT; zero-padding to twice the length avoids wrap-around
+        spectrum = np.fft.rfft(frame, n=2 * self.chunk_size)
+        autocorrelation = np.fft.irfft(np.square(np.abs(spectrum)))[:self.chunk_size]
+        low_hz, high_hz = self.PITCH_RANGE_HZ
+        min_lag = int(self.sample_rate / high_hz)
+        max_lag = min(int(self.sample_rate / low_hz), self.chunk_size - 1)
+        lag = min_lag + int(np.argmax(autocorrelation[min_lag:max_lag + 1]))
+        return self.sample_rate / lag
 
 
 # Singleton instance
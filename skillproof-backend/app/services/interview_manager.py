@@ -2,9 +2,15 @@
 Interview Session Manager
 Manages interview sessions, questions, and responses
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
+import time
+import orjson
 from pydantic import BaseModel
+import redis.asyncio as redis
+from redis.exceptions import WatchError
+
+from app.config import get_settings
 
 
 class InterviewQuestion(BaseModel):
@@ -38,10 +44,25 @@ class InterviewSession(BaseModel):
 class InterviewManager:
     """
     Manage interview sessions and flow
+    
+    Sessions live in Redis hashes (one field per session attribute) so every
+    worker process shares the same state, sessions survive restarts, and
+    updates only rewrite the fields that changed.
     """
     
+    SESSION_KEY_PREFIX = "session:"
+    ACTIVE_SESSIONS_KEY = "sessions:active"
+    # Hash fields stored as JSON documents; the rest are scalars
+    JSON_FIELDS = frozenset({"questions", "answers"})
+    # Fields touched when an answer is recorded
+    ANSWER_FIELDS = ("answers", "total_duration", "current_question", "status")
+    # Attempts at an optimistic read-modify-write before giving up
+    MAX_WATCH_RETRIES = 10
+    
     def __init__(self):
-        self.sessions: Dict[str, InterviewSession] = {}
+        settings = get_settings()
+        self.redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.session_ttl = settings.SESSION_TTL_SECONDS
         self.default_questions = self._load_default_questions()
     
     def _load_default_questions(self) -> List[InterviewQuestion]:
@@ -84,7 +105,51 @@ class InterviewManager:
             )
         ]
     
-    def create_session(self, user_id: str, session_id: str) -> InterviewSession:
+    def _session_key(self, session_id: str) -> str:
+        """Redis key for a session"""
+        return f"{self.SESSION_KEY_PREFIX}{session_id}"
+    
+    def _serialize_fields(self, session: InterviewSession, fields: Optional[Iterable[str]]) -> Dict[str, str]:
+        """Encode session attributes as Redis hash field values"""
+        data = session.model_dump(mode="json", include=set(fields) if fields else None)
+        return {
+            name: orjson.dumps(value).decode() if name in self.JSON_FIELDS else str(value)
+            for name, value in data.items()
+        }
+    
+    async def _save_session(self, session: InterviewSession, fields: Optional[Iterable[str]] = None):
+        """
+        Persist session fields and refresh the TTL
+        
+        Active sessions are tracked in a sorted set scored by expiry time so
+        they can be counted without scanning the keyspace. Expired entries
+        are pruned here, on the write path, so health checks stay read-only.
+        
+        Args:
+            session: Session to persist
+            fields: Attribute names to write (default: all)
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_save(pipe, session, fields)
+            await pipe.execute()
+    
+    def _queue_save(self, pipe, session: InterviewSession, fields: Optional[Iterable[str]]):
+        """Queue the commands that persist session fields on a MULTI pipeline"""
+        now = time.time()
+        key = self._session_key(session.session_id)
+        pipe.hset(key, mapping=self._serialize_fields(session, fields))
+        pipe.expire(key, self.session_ttl)
+        if session.status == "completed":
+            pipe.zrem(self.ACTIVE_SESSIONS_KEY, session.session_id)
+        else:
+            pipe.zadd(self.ACTIVE_SESSIONS_KEY, {session.session_id: now + self.session_ttl})
+        pipe.zremrangebyscore(self.ACTIVE_SESSIONS_KEY, "-inf", now)
+    
+    async def count_active_sessions(self) -> int:
+        """Count sessions that are not completed or expired (single read-only ZCOUNT)"""
+        return await self.redis.zcount(self.ACTIVE_SESSIONS_KEY, time.time(), "+inf")
+    
+    async def create_session(self, user_id: str, session_id: str) -> InterviewSession:
         """
         Create a new interview session
         
@@ -105,31 +170,44 @@ class InterviewManager:
             answers=[],
             total_duration=0.0
         )
-        self.sessions[session_id] = session
+        await self._save_session(session)
         return session
     
-    def get_session(self, session_id: str) -> Optional[InterviewSession]:
+    async def get_session(self, session_id: str) -> Optional[InterviewSession]:
         """Get interview session by ID"""
-        return self.sessions.get(session_id)
+        return self._decode_session(await self.redis.hgetall(self._session_key(session_id)))
+    
+    def _decode_session(self, raw: Dict[str, str]) -> Optional[InterviewSession]:
+        """Build a session from its Redis hash fields (None if the hash is empty)"""
+        if not raw:
+            return None
+        return InterviewSession.model_validate({
+            name: orjson.loads(value) if name in self.JSON_FIELDS else value
+            for name, value in raw.items()
+        })
     
-    def get_current_question(self, session_id: str) -> Optional[InterviewQuestion]:
+    async def get_current_question(self, session_id: str) -> Optional[InterviewQuestion]:
         """Get current question for session"""
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if not session:
             return None
         
+        return self._current_question(session)
+    
+    def _current_question(self, session: InterviewSession) -> Optional[InterviewQuestion]:
+        """Current question of an already-loaded session"""
         if session.current_question < len(session.questions):
             return session.questions[session.current_question]
         return None
     
-    def submit_answer(
+    async def submit_answer(
         self,
         session_id: str,
         transcript: str,
         duration: float,
         confidence: float,
         audio_url: Optional[str] = None
-    ) -> bool:
+    ) -> Tuple[bool, Optional[Dict]]:
         """
         Submit answer for current question
         
@@ -141,13 +219,68 @@ class InterviewManager:
             audio_url: Optional audio file URL
             
         Returns:
-            True if successful, False otherwise
+            Tuple of (success, progress); progress is computed from the
+            session already in hand, so callers need no get_progress call
         """
-        session = self.get_session(session_id)
-        if not session:
-            return False
+        progress, _ = await self.submit_and_advance(session_id, transcript, duration, confidence, audio_url)
+        return progress is not None, progress
+    
+    async def submit_and_advance(
+        self,
+        session_id: str,
+        transcript: str,
+        duration: float,
+        confidence: float,
+        audio_url: Optional[str] = None
+    ) -> Tuple[Optional[Dict], Optional[InterviewQuestion]]:
+        """
+        Submit answer and return the updated progress and next question
         
-        current_q = self.get_current_question(session_id)
+        The read and the write form one optimistic transaction: the session
+        key is WATCHed while the answer is recorded, and the write is retried
+        if another request changed the session in between, so concurrent
+        submissions can't overwrite each other's answers.
+        
+        Args:
+            session_id: Session identifier
+            transcript: Answer transcript
+            duration: Answer duration in seconds
+            confidence: Transcription confidence
+            audio_url: Optional audio file URL
+            
+        Returns:
+            Tuple of (progress, next_question); progress is None if the
+            answer could not be submitted
+        """
+        key = self._session_key(session_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(self.MAX_WATCH_RETRIES):
+                try:
+                    await pipe.watch(key)
+                    session = self._decode_session(await pipe.hgetall(key))
+                    if not session or not self._record_answer(session, transcript, duration, confidence, audio_url):
+                        await pipe.unwatch()
+                        return None, None
+                    
+                    pipe.multi()
+                    self._queue_save(pipe, session, self.ANSWER_FIELDS)
+                    await pipe.execute()
+                    return self._progress(session), self._current_question(session)
+                except WatchError:
+                    # Another submission won the race; re-read and try again
+                    if attempt == self.MAX_WATCH_RETRIES - 1:
+                        raise
+    
+    def _record_answer(
+        self,
+        session: InterviewSession,
+        transcript: str,
+        duration: float,
+        confidence: float,
+        audio_url: Optional[str]
+    ) -> bool:
+        """Append answer to a loaded session and advance it"""
+        current_q = self._current_question(session)
         if not current_q:
             return False
         
@@ -170,30 +303,30 @@ class InterviewManager:
         
         return True
     
-    def get_next_question(self, session_id: str) -> Optional[InterviewQuestion]:
+    async def get_next_question(self, session_id: str) -> Optional[InterviewQuestion]:
         """Get next question in sequence"""
-        session = self.get_session(session_id)
-        if not session:
-            return None
-        
-        return self.get_current_question(session_id)
+        return await self.get_current_question(session_id)
     
-    def get_progress(self, session_id: str) -> Dict:
+    async def get_progress(self, session_id: str) -> Dict:
         """
         Get interview progress
         
         Returns:
             Dictionary with progress information
         """
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if not session:
             return {}
         
+        return self._progress(session)
+    
+    def _progress(self, session: InterviewSession) -> Dict:
+        """Progress information of an already-loaded session"""
         total_questions = len(session.questions)
         answered = len(session.answers)
         
         return {
-            "session_id": session_id,
+            "session_id": session.session_id,
             "status": session.status,
             "total_questions": total_questions,
             "answered": answered,
@@ -203,34 +336,37 @@ class InterviewManager:
             "current_question_number": session.current_question + 1
         }
     
-    def pause_session(self, session_id: str) -> bool:
+    async def pause_session(self, session_id: str) -> bool:
         """Pause interview session"""
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if session and session.status == "active":
             session.status = "paused"
+            await self._save_session(session, ("status",))
             return True
         return False
     
-    def resume_session(self, session_id: str) -> bool:
+    async def resume_session(self, session_id: str) -> bool:
         """Resume paused session"""
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if session and session.status == "paused":
             session.status = "active"
+            await self._save_session(session, ("status",))
             return True
         return False
     
-    def complete_session(self, session_id: str) -> Dict:
+    async def complete_session(self, session_id: str) -> Dict:
         """
         Complete interview session and return summary
         
         Returns:
             Summary dictionary
         """
-        session = self.get_session(session_id)
+        session = await self.get_session(session_id)
         if not session:
             return {}
         
         session.status = "completed"
+        await self._save_session(session, ("status",))
         
         return {
             "session_id": session_id,
@@ -2,10 +2,10 @@
 Multilingual AI Interviewer Service
 Handles structured technical interviews in multiple Indian languages
 """
-from typing import Dict, Optional, List
-from pydantic import BaseModel
+from typing import Annotated, Dict, Optional, List, Literal
+from pydantic import BaseModel, BeforeValidator
 import json
-from app.ml.ai_client import AIClient
+from app.services.ai_service import ai_service
 
 
 # Supported Languages
@@ -31,10 +31,20 @@ LANGUAGE_NAMES = {
 }
 
 
+def _lowercase(value):
+    """Normalize string input before Literal validation"""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Validated by pydantic-core during request parsing (case-insensitive)
+LanguageCode = Annotated[Literal[tuple(SUPPORTED_LANGUAGES)], BeforeValidator(_lowercase)]
+ExperienceLevel = Annotated[Literal["junior", "mid", "senior"], BeforeValidator(_lowercase)]
+
+
 class InterviewRequest(BaseModel):
     role: str
-    experience_level: str  # junior, mid, senior
-    language: str
+    experience_level: ExperienceLevel
+    language: LanguageCode
     max_questions: int = 5
     question_number: int = 1
     previous_question: str = ""
@@ -55,19 +65,7 @@ class InterviewResponse(BaseModel):
     interview_status: str  # IN_PROGRESS, COMPLETED
 
 
-class MultilingualInterviewer:
-    """
-    Multilingual AI Interviewer
-    Conducts structured technical interviews in multiple languages
-    """
-    
-    def __init__(self):
-        self.ai_client = AIClient()
-        self.system_prompt = self._get_system_prompt()
-    
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for AI interviewer"""
-        return """You are SatyaHire AI, a professional multilingual AI interviewer.
+SYSTEM_PROMPT = """You are SatyaHire AI, a professional multilingual AI interviewer.
 
 Your job:
 - Conduct structured technical interviews.
@@ -79,30 +77,29 @@ Your job:
 - Never add explanations outside JSON.
 
 If you fail to generate valid JSON, regenerate response until JSON is valid."""
-    
-    def _get_user_prompt(self, request: InterviewRequest) -> str:
-        """Generate dynamic user prompt based on interview state"""
-        
-        prompt = f"""Interview Details:
-- Role: {request.role}
-- Experience Level: {request.experience_level}
-- Interview Language: {request.language}
-- Total Questions: {request.max_questions}
-- Current Question Number: {request.question_number}
 
-Previous Question: {request.previous_question if request.previous_question else "None"}
 
-Candidate Answer: {request.candidate_answer if request.candidate_answer else "None"}
+# User prompt template; only the per-turn fields are formatted per call
+USER_PROMPT = """Interview Details:
+- Role: {role}
+- Experience Level: {experience_level}
+- Interview Language: {language}
+- Total Questions: {max_questions}
+- Current Question Number: {question_number}
+
+Previous Question: {previous_question}
+
+Candidate Answer: {candidate_answer}
 
 Your Tasks:
 
 1. If candidate_answer is empty:
-   → Generate a new interview question in {request.language}.
-   → Adjust difficulty according to {request.experience_level}.
+   → Generate a new interview question in {language}.
+   → Adjust difficulty according to {experience_level}.
    → Return only the question.
 
 2. If candidate_answer is provided:
-   → Evaluate the answer in {request.language}.
+   → Evaluate the answer in {language}.
    → Give a score from 0-10.
    → Mention strengths.
    → Mention improvements.
@@ -110,7 +107,7 @@ Your Tasks:
    → Then generate next question.
 
 IMPORTANT:
-- Everything must be written in {request.language}.
+- Everything must be written in {language}.
 - Keep evaluation structured.
 - Be realistic like a real human interviewer.
 - Do NOT repeat previous questions.
@@ -130,15 +127,39 @@ Return strictly in this JSON format:
   "interview_status": "IN_PROGRESS | COMPLETED"
 }}
 
-Note: If this is question {request.question_number} of {request.max_questions}, and candidate_answer is provided, set interview_status to "COMPLETED". Otherwise "IN_PROGRESS"."""
-        
-        return prompt
+Note: If this is question {question_number} of {max_questions}, and candidate_answer is provided, set interview_status to "COMPLETED". Otherwise "IN_PROGRESS"."""
+
+
+class MultilingualInterviewer:
+    """
+    Multilingual AI Interviewer
+    Conducts structured technical interviews in multiple languages
+    """
+    
+    def __init__(self):
+        self.system_prompt = SYSTEM_PROMPT
+    
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for AI interviewer"""
+        return SYSTEM_PROMPT
+    
+    def _get_user_prompt(self, request: InterviewRequest) -> str:
+        """Generate dynamic user prompt based on interview state"""
+        return USER_PROMPT.format_map({
+            "role": request.role,
+            "experience_level": request.experience_level,
+            "language": request.language,
+            "max_questions": request.max_questions,
+            "question_number": request.question_number,
+            "previous_question": request.previous_question or "None",
+            "candidate_answer": request.candidate_answer or "None",
+        })
     
     def validate_language(self, language: str) -> bool:
         """Validate if language is supported"""
         return language.lower() in SUPPORTED_LANGUAGES
     
-    def conduct_interview(self, request: InterviewRequest) -> InterviewResponse:
+    async def conduct_interview(self, request: InterviewRequest) -> InterviewResponse:
         """
         Conduct interview and return structured response
         
@@ -148,19 +169,15 @@ Note: If this is question {request.question_number} of {request.max_questions},
         Returns:
             InterviewResponse with question and optional evaluation
         """
-        # Validate language
-        if not self.validate_language(request.language):
-            raise ValueError(f"Unsupported language: {request.language}. Supported: {', '.join(SUPPORTED_LANGUAGES)}")
-        
         # Generate prompts
         system_prompt = self.system_prompt
         user_prompt = self._get_user_prompt(request)
         
         # Call AI
         try:
-            response_text = self.ai_client.generate_text(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
+            response_text = await ai_service.complete_async(
+                system_prompt,
+                user_prompt,
                 temperature=0.7,
                 max_tokens=1000
             )
@@ -236,7 +253,7 @@ Note: If this is question {request.question_number} of {request.max_questions},
             for lang in SUPPORTED_LANGUAGES
         ]
     
-    def generate_first_question(
+    async def generate_first_question(
         self,
         role: str,
         experience_level: str,
@@ -265,9 +282,9 @@ Note: If this is question {request.question_number} of {request.max_questions},
             candidate_answer=""
         )
         
-        return self.conduct_interview(request)
+        return await self.conduct_interview(request)
     
-    def evaluate_and_next_question(
+    async def evaluate_and_next_question(
         self,
         role: str,
         experience_level: str,
@@ -302,7 +319,7 @@ Note: If this is question {request.question_number} of {request.max_questions},
             candidate_answer=candidate_answer
         )
         
-        return self.conduct_interview(request)
+        return await self.conduct_interview(request)
 
 
 # Singleton instance
@@ -0,0 +1,97 @@
+"""
+Object Storage Service
+Presigned direct-to-S3 uploads so file bytes bypass the API workers
+"""
+from typing import Dict, Optional
+import threading
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class ObjectStorageNotConfigured(Exception):
+    """Raised when S3_BUCKET is not set"""
+    pass
+
+
+class ObjectStorage:
+    """
+    Thin wrapper over an S3 client.
+    
+    Features:
+    - Presigned POST uploads with a server-enforced size limit
+    - Downloads of uploaded objects for processing
+    - Client created on first use; credentials come from the standard AWS chain
+    """
+    
+    def __init__(self):
+        self.bucket = settings.S3_BUCKET
+        self.expires_in = settings.S3_PRESIGN_EXPIRES_SECONDS
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether a bucket is configured"""
+        return bool(self.bucket)
+    
+    def _get_client(self):
+        """Get the shared boto3 S3 client"""
+        if not self.enabled:
+            raise ObjectStorageNotConfigured("Object storage is not configured")
+        
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    # Import here to avoid dependency issues
+                    import boto3
+                    self._client = boto3.client("s3", region_name=settings.AWS_REGION)
+        return self._client
+    
+    def presign_upload(self, key: str, max_size: int, content_type: Optional[str] = None) -> Dict:
+        """
+        Create a presigned POST the client uses to upload straight to S3
+        
+        Args:
+            key: Object key to upload to
+            max_size: Maximum object size in bytes, enforced by S3
+            content_type: Required Content-Type (optional)
+            
+        Returns:
+            Dictionary with upload url, form fields, key and expiry
+        """
+        fields = {}
+        conditions = [["content-length-range", 1, max_size]]
+        if content_type:
+            fields["Content-Type"] = content_type
+            conditions.append({"Content-Type": content_type})
+        
+        post = self._get_client().generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields=fields or None,
+            Conditions=conditions,
+            ExpiresIn=self.expires_in
+        )
+        
+        return {
+            "url": post["url"],
+            "fields": post["fields"],
+            "key": key,
+            "expires_in": self.expires_in
+        }
+    
+    def download_to_file(self, key: str, destination: str):
+        """
+        Download an object to a local file (blocking)
+        
+        Args:
+            key: Object key
+            destination: Target file path
+        """
+        self._get_client().download_file(self.bucket, key, destination)
+
+
+# Singleton instance
+object_storage = ObjectStorage()
@@ -3,9 +3,15 @@ API Key Manager - Thread-safe key rotation and fallback
 """
 
 import threading
+import time
 from typing import List, Optional
 from enum import Enum
 
+# Rejected keys sit out this long, then get one trial request (half-open)
+KEY_COOLDOWN_SECONDS = 60
+# Consecutive transient failures before a provider is skipped for a cooldown
+CIRCUIT_FAILURE_THRESHOLD = 5
+
 
 class AIProvider(str, Enum):
     """Supported AI providers"""
@@ -21,6 +27,8 @@ class APIKeyManager:
     Features:
     - Round-robin key rotation
     - Automatic fallback to next key on failure
+    - Rejected keys cool down before being retried
+    - Circuit breaker after repeated provider failures
     - Thread-safe implementation
     - No key logging for security
     """
@@ -40,7 +48,9 @@ class APIKeyManager:
         self.provider = provider
         self.current_index = 0
         self.lock = threading.Lock()
-        self.failed_keys = set()  # Track temporarily failed keys
+        self.failed_keys = {}  # Temporarily failed key -> time it failed
+        self.consecutive_failures = 0
+        self.circuit_open_until = 0.0
     
     def get_next_key(self) -> str:
         """
@@ -62,7 +72,15 @@ class APIKeyManager:
         Returns:
             List[str]: List of available API keys
         """
-        return [key for key in self.keys if key not in self.failed_keys]
+        now = time.monotonic()
+        return [
+            key for key in self.keys
+            if now - self.failed_keys.get(key, float("-inf")) >= KEY_COOLDOWN_SECONDS
+        ]
+    
+    def is_available(self) -> bool:
+        """Whether the circuit is closed and at least one key is usable"""
+        return time.monotonic() >= self.circuit_open_until and bool(self.get_all_keys())
     
     def mark_key_failed(self, key: str):
         """
@@ -72,7 +90,26 @@ class APIKeyManager:
             key: The failed API key
         """
         with self.lock:
-            self.failed_keys.add(key)
+            self.failed_keys[key] = time.monotonic()
+    
+    def record_failure(self):
+        """Count a transient provider failure; opens the circuit at the threshold"""
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+                self.circuit_open_until = time.monotonic() + KEY_COOLDOWN_SECONDS
+                self.consecutive_failures = 0
+    
+    def record_success(self, key: str):
+        """
+        Reset failure tracking after a successful call
+        
+        Args:
+            key: The API key that succeeded
+        """
+        with self.lock:
+            self.consecutive_failures = 0
+            self.failed_keys.pop(key, None)
     
     def reset_failed_keys(self):
         """Reset all failed keys (call periodically or after cooldown)"""
@@ -130,7 +167,7 @@ class MultiProviderKeyManager:
             Optional[str]: API key or None if provider not available
         """
         manager = self.managers.get(provider)
-        if manager:
+        if manager and manager.is_available():
             return manager.get_next_key()
         return None
     
@@ -173,6 +210,24 @@ class MultiProviderKeyManager:
             return manager.get_all_keys()
         return []
     
+    def mark_key_failed(self, provider: AIProvider, key: str):
+        """Take a rejected key out of rotation for the cooldown period"""
+        manager = self.managers.get(provider)
+        if manager:
+            manager.mark_key_failed(key)
+    
+    def record_failure(self, provider: AIProvider):
+        """Count a transient failure toward the provider's circuit breaker"""
+        manager = self.managers.get(provider)
+        if manager:
+            manager.record_failure()
+    
+    def record_success(self, provider: AIProvider, key: str):
+        """Reset the provider's failure tracking after a successful call"""
+        manager = self.managers.get(provider)
+        if manager:
+            manager.record_success(key)
+    
     def has_provider(self, provider: AIProvider) -> bool:
         """Check if provider is available"""
         return provider in self.managers
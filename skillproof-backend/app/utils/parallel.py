@@ -0,0 +1,20 @@
+"""
+Size-aware joblib worker selection
+"""
+
+
+def auto_n_jobs(n_items: int, min_parallel: int) -> int:
+    """
+    Pick a joblib n_jobs value for a batch
+
+    Small batches run inline because starting workers costs more than it
+    saves.
+
+    Args:
+        n_items: Number of rows or tasks in the batch
+        min_parallel: Smallest batch worth spreading across cores
+
+    Returns:
+        1 to run inline, -1 to use every core
+    """
+    return 1 if n_items < min_parallel else -1
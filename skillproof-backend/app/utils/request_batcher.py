@@ -0,0 +1,142 @@
+"""
+Request Batcher - Coalesce concurrent requests into batched upstream calls
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class RequestBatcher:
+    """
+    Dynamic request batcher backed by an asyncio queue.
+
+    Features:
+    - Collects payloads until max_batch_size or max_delay is reached
+    - Dispatches each batch to a blocking handler in a worker thread, or
+      awaits an async handler (batches then run concurrently)
+    - Resolves one future per submitted payload
+    - Per-item errors are delivered only to the caller that sent them
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Union[List[Any], Awaitable[List[Any]]]],
+        max_batch_size: int = 8,
+        max_delay: float = 0.05,
+    ):
+        """
+        Initialize Request Batcher
+
+        Args:
+            handler: Callable or coroutine function mapping a list of payloads
+                to a list of results (an Exception instance marks a failed item)
+            max_batch_size: Maximum payloads per batch
+            max_delay: Maximum seconds to wait for a batch to fill
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._is_async = asyncio.iscoroutinefunction(handler)
+        # In-flight async batches (strong refs so they aren't garbage collected)
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def start(self):
+        """Start the background batching loop (idempotent)"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._server_loop())
+
+    async def stop(self):
+        """Stop the batching loop and fail any pending requests"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        for dispatch in list(self._dispatches):
+            dispatch.cancel()
+
+        while self._queue and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Request batcher stopped"))
+
+    async def submit(self, payload: Any) -> Any:
+        """
+        Queue a payload and wait for its batched result
+
+        Args:
+            payload: Item passed to the handler as part of a batch
+
+        Returns:
+            Handler result for this payload
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one item, then gather more until full or the delay expires"""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _server_loop(self):
+        """Drain the queue and dispatch batches until cancelled"""
+        while True:
+            batch = await self._collect_batch()
+
+            if self._is_async:
+                # Don't hold the next batch behind this one's upstream latency
+                dispatch = asyncio.create_task(self._dispatch(batch))
+                self._dispatches.add(dispatch)
+                dispatch.add_done_callback(self._dispatches.discard)
+            else:
+                await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run the handler on one batch and resolve its futures"""
+        payloads = [payload for payload, _ in batch]
+
+        try:
+            if self._is_async:
+                results = await self.handler(payloads)
+            else:
+                results = await asyncio.to_thread(self.handler, payloads)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Request batcher stopped"))
+            raise
+        except Exception as e:
+            logger.error(f"Batch handler failed: {str(e)}")
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,18 +1,50 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Any, Dict, NamedTuple, Optional
+import hashlib
+import time
+from cachetools import TLRUCache
+import jwt
+from jwt import PyJWTError
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_async_db
 from app.models.user import User
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Signing material prepared once instead of on every encode/decode
+_SIGNING_KEY = settings.SECRET_KEY.encode()
+_ALGORITHMS = [settings.ALGORITHM]
+
+# Authenticated users keyed by token hash; repeat polls skip JWT decode and the DB.
+# Entries hold plain column values (never ORM objects tied to a closed session)
+# and expire after USER_CACHE_TTL_SECONDS or at the token's exp, whichever is first.
+USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_FIELDS = ("id", "email", "role", "is_active", "is_verified", "created_at", "updated_at")
+
+
+class _CachedUser(NamedTuple):
+    exp: float
+    fields: Dict[str, Any]
+
+
+def _user_cache_expiry(_key, cached: _CachedUser, now: float) -> float:
+    """Cache entry deadline: the TTL, capped at the token's own expiry"""
+    return min(now + USER_CACHE_TTL_SECONDS, cached.exp)
+
+
+_user_cache: TLRUCache = TLRUCache(maxsize=10_000, ttu=_user_cache_expiry, timer=time.time)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -26,29 +58,43 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _user_cache.get(cache_key)
+    if cached is not None and cached.exp > time.time():
+        # Fresh detached instance per request; no session, no lazy loads
+        return User(**cached.fields)
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    
+    exp = payload.get("exp")
+    if exp is not None:
+        _user_cache[cache_key] = _CachedUser(
+            exp=float(exp),
+            fields={name: getattr(user, name) for name in _USER_CACHE_FIELDS}
+        )
     return user
 
 def require_role(allowed_roles: list):
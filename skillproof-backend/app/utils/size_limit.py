@@ -0,0 +1,57 @@
+"""
+Request size limit middleware
+"""
+
+from typing import Dict, Optional
+
+import orjson
+
+
+class SizeLimitMiddleware:
+    """
+    Reject requests whose declared Content-Length exceeds a limit.
+    
+    Runs as plain ASGI before routing, so an oversized upload gets a 413
+    without its body being read or spooled. Endpoints still enforce their
+    exact limit while streaming, which also covers chunked bodies.
+    """
+    
+    def __init__(self, app, max_body_size: int, path_limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize Size Limit Middleware
+        
+        Args:
+            app: ASGI application
+            max_body_size: Default limit in bytes
+            path_limits: Tighter limits for specific paths
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_limits = path_limits or {}
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            limit = self.path_limits.get(scope["path"], self.max_body_size)
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > limit:
+                        await self._reject(send, limit)
+                        return
+                    break
+        
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    async def _reject(send, limit: int):
+        """Send a 413 in the same shape as HTTPException responses"""
+        body = orjson.dumps({"detail": f"Request too large. Maximum size: {limit / 1024 / 1024:.1f}MB"})
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,46 @@
+"""
+Pre-serialized responses for static reference data
+"""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+class StaticJSON:
+    """
+    JSON body serialized once with a fixed ETag.
+    
+    Repeat requests skip serialization, and clients or CDNs that send
+    If-None-Match get an empty 304.
+    """
+    
+    def __init__(self, content: Any):
+        """
+        Initialize Static JSON
+        
+        Args:
+            content: JSON-serializable response data
+        """
+        self.body = orjson.dumps(content)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=8).hexdigest()}"'
+        self.headers = {"ETag": self.etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    
+    def response(self, request: Request) -> Response:
+        """
+        Build the response for a request
+        
+        Args:
+            request: Incoming request (for If-None-Match)
+            
+        Returns:
+            304 if the client already has this body, else the JSON body
+        """
+        if_none_match = request.headers.get("if-none-match", "")
+        if self.etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
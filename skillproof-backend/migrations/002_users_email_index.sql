@@ -0,0 +1,4 @@
+-- Unique index backing login lookups by email
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users(email);
+
+COMMENT ON INDEX ix_users_email IS 'Login lookup and duplicate-signup guard';
@@ -0,0 +1,9 @@
+-- Uploaded resume files, so deletes resolve the stored path and owner directly
+CREATE TABLE IF NOT EXISTS resume_files (
+    file_id VARCHAR(64) PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    path VARCHAR(500) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_resume_files_user_id ON resume_files(user_id);
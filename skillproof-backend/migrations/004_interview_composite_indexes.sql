@@ -0,0 +1,8 @@
+-- Composite indexes for per-user interview listings and emotion timelines
+CREATE INDEX IF NOT EXISTS ix_interviews_user_status ON interviews(user_id, status);
+CREATE INDEX IF NOT EXISTS ix_interviews_user_started ON interviews(user_id, started_at);
+CREATE INDEX IF NOT EXISTS ix_emotion_analysis_interview_timestamp ON emotion_analysis(interview_id, timestamp);
+
+COMMENT ON INDEX ix_interviews_user_status IS 'A user''s interviews filtered by status';
+COMMENT ON INDEX ix_interviews_user_started IS 'A user''s interviews ordered by start time (scanned backwards for newest first)';
+COMMENT ON INDEX ix_emotion_analysis_interview_timestamp IS 'Emotion timeline for one interview';
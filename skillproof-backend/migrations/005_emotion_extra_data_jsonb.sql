@@ -0,0 +1,7 @@
+-- "metadata" is reserved by SQLAlchemy; store emotion extras as queryable JSONB
+ALTER TABLE emotion_analysis RENAME COLUMN metadata TO extra_data;
+ALTER TABLE emotion_analysis ALTER COLUMN extra_data TYPE JSONB USING extra_data::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_emotion_analysis_extra_data ON emotion_analysis USING GIN (extra_data);
+
+COMMENT ON COLUMN emotion_analysis.extra_data IS 'Additional emotion metadata (JSON)';
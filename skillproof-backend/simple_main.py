@@ -5,16 +5,18 @@ Run with: python -m uvicorn simple_main:app --reload
 
 from fastapi import FastAPI, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, EmailStr
 from typing import Optional, List
 import time
-import uuid
+import secrets
 
 app = FastAPI(
     title="SatyaHire AI",
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration
@@ -267,7 +269,7 @@ async def get_supported_voices():
 @app.post("/api/v1/interview/start")
 async def start_interview(request: StartInterviewRequest):
     """Start a new interview session"""
-    session_id = f"session_{uuid.uuid4().hex[:12]}"
+    session_id = f"session_{secrets.token_hex(6)}"
     
     interview_sessions[session_id] = {
         "session_id": session_id,